@@ -72,6 +72,8 @@ def update_config(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         print(f"Error updating config: {e}")
         return create_error_response(500, "Failed to update configuration")
         
+    manager.invalidate(config_type)
+
     return create_response(200, {
         "message": "Configuration updated successfully",
         "type": config_type,
@@ -10,15 +10,34 @@ try:
     from shared.conversation_state import ConversationState
     from shared.twilio_client import TwilioClient
     from shared.config_manager import ConfigManager
+    from shared.http_pool import HTTP, basic_auth_headers
 except ImportError:
     from lambdas.shared.conversation_state import ConversationState
     from lambdas.shared.twilio_client import TwilioClient
     from lambdas.shared.config_manager import ConfigManager
+    from lambdas.shared.http_pool import HTTP, basic_auth_headers
 
 import boto3
 import os
 import re
-import requests
+
+# vCard fields from WhatsApp contact shares (compiled once per container)
+_VCARD_FN_RE = re.compile(r"FN:(.*)")
+_VCARD_TEL_RE = re.compile(r"TEL.*:(.*)")
+_VCARD_TIMEOUT = 5
+
+
+def _fetch_vcard(contact_vcard_url: str, creds: Dict[str, Any]):
+    """Download a shared contact card over the pooled connection; None on failure."""
+    resp = HTTP.request(
+        "GET",
+        contact_vcard_url,
+        headers=basic_auth_headers(creds.get("account_sid"), creds.get("auth_token")),
+        timeout=_VCARD_TIMEOUT,
+    )
+    if resp.status != 200:
+        return None
+    return resp.data.decode("utf-8", "replace")
 
 def handle_stop_work(
     user_input_text: str, 
@@ -87,21 +106,16 @@ def handle_responsible_person(
         try:
             print(f"Fetching vCard: {contact_vcard_url}")
             # Twilio media URLs require HTTP Basic Auth
-            from lambdas.shared.twilio_client import TwilioClient
             twilio_client = TwilioClient()
             creds = twilio_client._get_credentials()
-            resp = requests.get(
-                contact_vcard_url,
-                auth=(creds.get("account_sid"), creds.get("auth_token"))
-            )
-            if resp.status_code == 200:
-                vcard_data = resp.text
+            vcard_data = _fetch_vcard(contact_vcard_url, creds)
+            if vcard_data is not None:
                 # Extract Valid Name (FN)
-                fn_match = re.search(r"FN:(.*)", vcard_data)
+                fn_match = _VCARD_FN_RE.search(vcard_data)
                 full_name = fn_match.group(1).strip() if fn_match else "Unknown Contact"
                 
                 # Extract Phones (TEL)
-                phones = re.findall(r"TEL.*:(.*)", vcard_data)
+                phones = _VCARD_TEL_RE.findall(vcard_data)
                 phones = [p.strip() for p in phones if p.strip()]
                 
                 if len(phones) > 1:
@@ -253,17 +267,12 @@ def handle_notified_persons(
     # 1. Handle vCard
     if contact_vcard_url:
         try:
-            from lambdas.shared.twilio_client import TwilioClient
             twilio_client = TwilioClient()
             creds = twilio_client._get_credentials()
-            resp = requests.get(
-                contact_vcard_url,
-                auth=(creds.get("account_sid"), creds.get("auth_token"))
-            )
-            if resp.status_code == 200:
-                vcard_data = resp.text
-                full_name = re.search(r"FN:(.*)", vcard_data).group(1).strip()
-                phones = [p.strip() for p in re.findall(r"TEL.*:(.*)", vcard_data) if p.strip()]
+            vcard_data = _fetch_vcard(contact_vcard_url, creds)
+            if vcard_data is not None:
+                full_name = _VCARD_FN_RE.search(vcard_data).group(1).strip()
+                phones = [p.strip() for p in _VCARD_TEL_RE.findall(vcard_data) if p.strip()]
                 
                 if len(phones) > 1:
                     rows = [{"id": f"sel_notif_{i}", "title": p[:24], "description": full_name[:72]} for i, p in enumerate(phones)]
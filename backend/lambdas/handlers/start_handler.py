@@ -153,7 +153,11 @@ def handle_start(
         
         # 4. Check Project Selection
         user_project_manager = UserProjectManager()
-        last_project = user_project_manager.get_last_project(phone_number)
+        # Strongly consistent: the project the user picked on their previous
+        # report must be pre-selected even if a DAX cache still holds the old one
+        last_project = user_project_manager.get_last_project(
+            phone_number, consistent_read=True
+        )
         
         draft_data = {
             "imageId": request_id,
@@ -190,13 +190,6 @@ def confirm_document_upload(event, _context):
         user_id=user_id,
     )
 
-    kb_repository = _get_kb_repository()
-    kb_repository.increment_document_stats(
-        user_id=knowledge_base["userId"],
-        kb_id=knowledge_base["kbId"],
-        size=int(body.get("fileSize") or 0),
-    )
-
     message = {
         "kbId": knowledge_base["kbId"],
         "documentId": document["documentId"],
@@ -209,15 +202,21 @@ def confirm_document_upload(event, _context):
         ),
     }
 
-    sqs_client = _get_sqs_client()
-    sqs_client.send_message(
-        QueueUrl=INDEXING_QUEUE_URL, MessageBody=json.dumps(message)
-    )
-
-    document_repository.update_status(
+    # Mark the document as processing and bump the KB stats in one write.
+    # This must land before the indexing job is queued: a failed write then
+    # aborts the upload instead of leaving an indexed document uncounted.
+    document_repository.update_status_and_stats(
         kb_id=knowledge_base["kbId"],
         document_id=document["documentId"],
         status="processing",
+        kb_table_name=_get_kb_repository().table_name,
+        owner_id=knowledge_base["userId"],
+        size_delta=document["fileSize"],
+    )
+
+    sqs_client = _get_sqs_client()
+    sqs_client.send_message(
+        QueueUrl=INDEXING_QUEUE_URL, MessageBody=json.dumps(message)
     )
 
     return create_response(
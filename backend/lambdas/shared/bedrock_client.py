@@ -3,6 +3,7 @@
 import os
 import json
 import base64
+from datetime import datetime
 from typing import Dict, List
 import boto3
 
@@ -44,8 +45,6 @@ class BedrockClient:
         # Format timestamp for the prompt if provided
         timestamp_info = ""
         if timestamp:
-            from datetime import datetime
-
             try:
                 dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
                 formatted_date = dt.strftime("%B %d, %Y, at %I:%M %p UTC")
@@ -4,10 +4,193 @@ Reads/Writes configuration to the ReportsTable (PK=CONFIG).
 """
 
 import os
-import boto3
-from typing import List, Dict, Any, Optional
+import time
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 from botocore.exceptions import ClientError
 
+from .aws_clients import get_dax_resource, get_table
+
+# Config rows change rarely, so warm containers serve them from memory.
+# Keyed by (table name, upper-cased config type) -> (fetched_at, frozen values).
+_CONFIG_CACHE: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+_CONFIG_TTL = int(os.environ.get("CONFIG_CACHE_TTL", "300"))
+# BatchGetItem UnprocessedKeys retries: exponential backoff, capped attempts
+_BATCH_GET_MAX_ATTEMPTS = 5
+_BATCH_GET_BASE_DELAY = 0.05
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert lists/dicts/sets to tuples/read-only mappings/frozensets."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Fresh mutable copy of a frozen value, so callers never touch shared state."""
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, frozenset):
+        return {_thaw(v) for v in value}
+    return value
+
+
+# Hardcoded defaults, frozen once at import; lookups hand out thawed copies
+_DEFAULTS: Mapping[str, Tuple[Any, ...]] = _freeze({
+    "LOCATIONS": [
+        "Main Building",
+        "Site Office",
+        "Working Area A",
+        "Working Area B",
+        "Storage Yard",
+        "Roof Level"
+    ],
+    "HAZARD_TAXONOMY": [
+        # Safety (A)
+        {"code": "A1", "name": "Confined Spaces", "category": "Safety"},
+        {"code": "A2", "name": "Electrical Safety", "category": "Safety"},
+        {"code": "A3", "name": "Excavation & Trenching", "category": "Safety"},
+        {"code": "A4", "name": "Fire Prevention", "category": "Safety"},
+        {"code": "A5", "name": "Hazardous Materials", "category": "Safety"},
+        {"code": "A6", "name": "Hot Works", "category": "Safety"},
+        {"code": "A7", "name": "Housekeeping", "category": "Safety"},
+        {"code": "A8", "name": "Lifting Operations", "category": "Safety"},
+        {"code": "A9", "name": "Lighting", "category": "Safety"},
+        {"code": "A10", "name": "Manual Handling", "category": "Safety"},
+        {"code": "A11", "name": "Material Storage", "category": "Safety"},
+        {"code": "A12", "name": "Mobile Plant & Equipment", "category": "Safety"},
+        {"code": "A13", "name": "Site Welfare Facilities", "category": "Safety"},
+        {"code": "A14", "name": "Tunnelling", "category": "Safety"},
+        {"code": "A15", "name": "Working at Height / Fall Protection", "category": "Safety"},
+        {"code": "A16", "name": "Working on or Near Live Roads", "category": "Safety"},
+        {"code": "A17", "name": "Working on or near Water", "category": "Safety"},
+        {"code": "A18", "name": "Man & Machine Interface", "category": "Safety"},
+        {"code": "A19", "name": "Traffic Management", "category": "Safety"},
+        {"code": "A20", "name": "Formwork & Falsework", "category": "Safety"},
+        {"code": "A21", "name": "Scaffolding", "category": "Safety"},
+        {"code": "A22", "name": "Emergency Response", "category": "Safety"},
+        {"code": "A23", "name": "Security", "category": "Safety"},
+        {"code": "A24", "name": "Signage & Communication", "category": "Safety"},
+        {"code": "A25", "name": "Hand & Power Tools", "category": "Safety"},
+        {"code": "A26", "name": "Site Establishment", "category": "Safety"},
+        {"code": "A27", "name": "Airside Safety", "category": "Safety"},
+        {"code": "A28", "name": "Lock-Out / Tag-Out", "category": "Safety"},
+        {"code": "A29", "name": "Permit to Work", "category": "Safety"},
+        {"code": "A30", "name": "Radiation Safety", "category": "Safety"},
+        {"code": "A31", "name": "Site Logistics", "category": "Safety"},
+        {"code": "A32", "name": "Subcontractor Management", "category": "Safety"},
+        {"code": "A33", "name": "Training & Awareness", "category": "Safety"},
+        {"code": "A34", "name": "Underground Utilities", "category": "Safety"},
+        {"code": "A35", "name": "Access / Egress", "category": "Safety"},
+        {"code": "A36", "name": "Barrication", "category": "Safety"},
+        {"code": "A37", "name": "Public Safety & Protection", "category": "Safety"},
+        {"code": "A38", "name": "Safety Devices / Equipment", "category": "Safety"},
+        {"code": "A39", "name": "PPE", "category": "Safety"},
+        {"code": "A40", "name": "Documentation", "category": "Safety"},
+        {"code": "A41", "name": "Others", "category": "Safety"},
+
+        # Environment (B)
+        {"code": "B1", "name": "Noise", "category": "Environment"},
+        {"code": "B2", "name": "Environmental Protection", "category": "Environment"},
+        {"code": "B3", "name": "Waste Management", "category": "Environment"},
+        {"code": "B4", "name": "Dust Suppression & Emissions", "category": "Environment"},
+        {"code": "B5", "name": "Air Emissions & Quality", "category": "Environment"},
+        {"code": "B6", "name": "Flora & Fauna", "category": "Environment"},
+        {"code": "B7", "name": "Soil Erosion", "category": "Environment"},
+        {"code": "B8", "name": "Water Discharge / Contamination", "category": "Environment"},
+        {"code": "B9", "name": "Groundwater Protection", "category": "Environment"},
+        {"code": "B10", "name": "Flood Mitigation", "category": "Environment"},
+        {"code": "B11", "name": "Sustainability", "category": "Environment"},
+
+        # Health (C)
+        {"code": "C1", "name": "Working in the Heat", "category": "Health"},
+        {"code": "C2", "name": "Ergonomics", "category": "Health"},
+        {"code": "C3", "name": "Occupational Health", "category": "Health"},
+        {"code": "C4", "name": "Pest Control", "category": "Health"}
+    ],
+    "OBSERVATION_TYPES": [
+        "Unsafe Condition (UC)",
+        "Unsafe Act (UA)",
+        "Near Miss (NM)",
+        "Good Practice (GP)"
+    ],
+    "BREACH_SOURCES": [
+        "Almabani",
+        "Subcontractor"
+    ],
+    "SEVERITY_LEVELS": [
+        "High",
+        "Medium",
+        "Low"
+    ],
+    "STOPPAGE_OPTIONS": [
+        "Yes",
+        "No"
+    ],
+    "RESPONSIBLE_PERSONS": [
+        "Site Engineer A",
+        "Site Engineer B",
+        "Safety Officer X",
+        "Project Manager Y"
+    ],
+    "PROJECTS": [
+        {
+            "id": "PROJ-001",
+            "name": "Riyadh Metro Line 3",
+            "locations": ["Main Station", "Tunnel A", "Tunnel B", "Storage Yard"],
+            "responsiblePersons": [
+                {"name": "Eng. John", "phone": "+966 50 123 4567"},
+                {"name": "Supervisor Mike", "phone": "+966 50 234 5678"},
+                {"name": "Safety Officer Ali"}
+            ]
+        },
+        {
+            "id": "PROJ-002",
+            "name": "King Salman Park",
+            "locations": ["Visitor Center", "Landscape Zone A", "Construction Site B"],
+            "responsiblePersons": [
+                {"name": "Eng. Sarah", "phone": "+966 50 345 6789"},
+                {"name": "Manager David"}
+            ]
+        },
+        {
+            "id": "PROJ-003",
+            "name": "Red Sea Airport",
+            "locations": ["Terminal 1", "Runway", "ATC Tower"],
+            "responsiblePersons": [
+                {"name": "Eng. Ahmed", "phone": "+966 50 456 7890"},
+                {"name": "Supervisor Khaled", "phone": "+966 50 567 8901"}
+            ]
+        },
+        {
+            "id": "PROJ-004",
+            "name": "Diriyah Gate",
+            "locations": ["Heritage Site", "Museum", "Parking Area"],
+            "responsiblePersons": [
+                {"name": "Eng. Faisal"},
+                {"name": "Safety Manager Tom", "phone": "+966 50 678 9012"}
+            ]
+        },
+        {
+            "id": "PROJ-005",
+            "name": "NEOM The Line",
+            "locations": ["Module 42", "Spine Layer", "Logistics Hub"],
+            "responsiblePersons": [
+                {"name": "Director James", "phone": "+966 50 789 0123"},
+                {"name": "Lead Eng. Sam"}
+            ]
+        }
+    ]
+})
+
+
 class ConfigManager:
     """Manages dynamic configuration in DynamoDB."""
     
@@ -16,179 +199,112 @@ class ConfigManager:
         if not self.table_name:
              self.table_name = "taskflow-backend-dev-reports" # Fallback
              
-        self.dynamodb = boto3.resource("dynamodb")
-        self.table = self.dynamodb.Table(self.table_name)
+        # Point reads here tolerate DAX's eventually consistent item cache
+        self.dynamodb = get_dax_resource()
+        self.table = get_table(self.table_name, use_dax=True)
         
     def get_options(self, config_type: str) -> List[str]:
         """
         Get options for a specific type (e.g. 'LOCATIONS', 'BREACH_SOURCES').
         Returns list of strings.
         """
+        cache_key = config_type.upper()
+        cached = _CONFIG_CACHE.get((self.table_name, cache_key))
+        if cached and time.monotonic() - cached[0] < _CONFIG_TTL:
+            return _thaw(cached[1])
+
         try:
             # PK=CONFIG, SK=TYPE
             response = self.table.get_item(
                 Key={
                     "PK": "CONFIG",
-                    "SK": config_type.upper()
+                    "SK": cache_key
                 }
             )
             item = response.get("Item")
             if item and "values" in item:
-                return item["values"]
-            
-            # Return defaults if not found
-            return self._get_defaults(config_type)
+                values = item["values"]
+            else:
+                # Return defaults if not found
+                values = self._get_defaults(config_type)
+
+            _CONFIG_CACHE[(self.table_name, cache_key)] = (time.monotonic(), _freeze(values))
+            return values
             
         except ClientError as e:
             print(f"Error fetching config {config_type}: {e}")
             return self._get_defaults(config_type)
 
-    def _get_defaults(self, config_type: str) -> List[str]:
-        """Return hardcoded defaults if DB is empty."""
-        defaults = {
-            "LOCATIONS": [
-                "Main Building",
-                "Site Office",
-                "Working Area A",
-                "Working Area B",
-                "Storage Yard",
-                "Roof Level"
-            ],
-            "HAZARD_TAXONOMY": [
-                # Safety (A)
-                {"code": "A1", "name": "Confined Spaces", "category": "Safety"},
-                {"code": "A2", "name": "Electrical Safety", "category": "Safety"},
-                {"code": "A3", "name": "Excavation & Trenching", "category": "Safety"},
-                {"code": "A4", "name": "Fire Prevention", "category": "Safety"},
-                {"code": "A5", "name": "Hazardous Materials", "category": "Safety"},
-                {"code": "A6", "name": "Hot Works", "category": "Safety"},
-                {"code": "A7", "name": "Housekeeping", "category": "Safety"},
-                {"code": "A8", "name": "Lifting Operations", "category": "Safety"},
-                {"code": "A9", "name": "Lighting", "category": "Safety"},
-                {"code": "A10", "name": "Manual Handling", "category": "Safety"},
-                {"code": "A11", "name": "Material Storage", "category": "Safety"},
-                {"code": "A12", "name": "Mobile Plant & Equipment", "category": "Safety"},
-                {"code": "A13", "name": "Site Welfare Facilities", "category": "Safety"},
-                {"code": "A14", "name": "Tunnelling", "category": "Safety"},
-                {"code": "A15", "name": "Working at Height / Fall Protection", "category": "Safety"},
-                {"code": "A16", "name": "Working on or Near Live Roads", "category": "Safety"},
-                {"code": "A17", "name": "Working on or near Water", "category": "Safety"},
-                {"code": "A18", "name": "Man & Machine Interface", "category": "Safety"},
-                {"code": "A19", "name": "Traffic Management", "category": "Safety"},
-                {"code": "A20", "name": "Formwork & Falsework", "category": "Safety"},
-                {"code": "A21", "name": "Scaffolding", "category": "Safety"},
-                {"code": "A22", "name": "Emergency Response", "category": "Safety"},
-                {"code": "A23", "name": "Security", "category": "Safety"},
-                {"code": "A24", "name": "Signage & Communication", "category": "Safety"},
-                {"code": "A25", "name": "Hand & Power Tools", "category": "Safety"},
-                {"code": "A26", "name": "Site Establishment", "category": "Safety"},
-                {"code": "A27", "name": "Airside Safety", "category": "Safety"},
-                {"code": "A28", "name": "Lock-Out / Tag-Out", "category": "Safety"},
-                {"code": "A29", "name": "Permit to Work", "category": "Safety"},
-                {"code": "A30", "name": "Radiation Safety", "category": "Safety"},
-                {"code": "A31", "name": "Site Logistics", "category": "Safety"},
-                {"code": "A32", "name": "Subcontractor Management", "category": "Safety"},
-                {"code": "A33", "name": "Training & Awareness", "category": "Safety"},
-                {"code": "A34", "name": "Underground Utilities", "category": "Safety"},
-                {"code": "A35", "name": "Access / Egress", "category": "Safety"},
-                {"code": "A36", "name": "Barrication", "category": "Safety"},
-                {"code": "A37", "name": "Public Safety & Protection", "category": "Safety"},
-                {"code": "A38", "name": "Safety Devices / Equipment", "category": "Safety"},
-                {"code": "A39", "name": "PPE", "category": "Safety"},
-                {"code": "A40", "name": "Documentation", "category": "Safety"},
-                {"code": "A41", "name": "Others", "category": "Safety"},
-
-                # Environment (B)
-                {"code": "B1", "name": "Noise", "category": "Environment"},
-                {"code": "B2", "name": "Environmental Protection", "category": "Environment"},
-                {"code": "B3", "name": "Waste Management", "category": "Environment"},
-                {"code": "B4", "name": "Dust Suppression & Emissions", "category": "Environment"},
-                {"code": "B5", "name": "Air Emissions & Quality", "category": "Environment"},
-                {"code": "B6", "name": "Flora & Fauna", "category": "Environment"},
-                {"code": "B7", "name": "Soil Erosion", "category": "Environment"},
-                {"code": "B8", "name": "Water Discharge / Contamination", "category": "Environment"},
-                {"code": "B9", "name": "Groundwater Protection", "category": "Environment"},
-                {"code": "B10", "name": "Flood Mitigation", "category": "Environment"},
-                {"code": "B11", "name": "Sustainability", "category": "Environment"},
-
-                # Health (C)
-                {"code": "C1", "name": "Working in the Heat", "category": "Health"},
-                {"code": "C2", "name": "Ergonomics", "category": "Health"},
-                {"code": "C3", "name": "Occupational Health", "category": "Health"},
-                {"code": "C4", "name": "Pest Control", "category": "Health"}
-            ],
-            "OBSERVATION_TYPES": [
-                "Unsafe Condition (UC)",
-                "Unsafe Act (UA)",
-                "Near Miss (NM)",
-                "Good Practice (GP)"
-            ],
-            "BREACH_SOURCES": [
-                "Almabani",
-                "Subcontractor"
-            ],
-            "SEVERITY_LEVELS": [
-                "High",
-                "Medium",
-                "Low"
-            ],
-            "STOPPAGE_OPTIONS": [
-                "Yes",
-                "No"
-            ],
-            "RESPONSIBLE_PERSONS": [
-                "Site Engineer A",
-                "Site Engineer B",
-                "Safety Officer X",
-                "Project Manager Y"
-            ],
-            "PROJECTS": [
-                {
-                    "id": "PROJ-001",
-                    "name": "Riyadh Metro Line 3",
-                    "locations": ["Main Station", "Tunnel A", "Tunnel B", "Storage Yard"],
-                    "responsiblePersons": [
-                        {"name": "Eng. John", "phone": "+966 50 123 4567"},
-                        {"name": "Supervisor Mike", "phone": "+966 50 234 5678"},
-                        {"name": "Safety Officer Ali"}
-                    ]
-                },
-                {
-                    "id": "PROJ-002",
-                    "name": "King Salman Park",
-                    "locations": ["Visitor Center", "Landscape Zone A", "Construction Site B"],
-                    "responsiblePersons": [
-                        {"name": "Eng. Sarah", "phone": "+966 50 345 6789"},
-                        {"name": "Manager David"}
-                    ]
-                },
-                {
-                    "id": "PROJ-003",
-                    "name": "Red Sea Airport",
-                    "locations": ["Terminal 1", "Runway", "ATC Tower"],
-                    "responsiblePersons": [
-                        {"name": "Eng. Ahmed", "phone": "+966 50 456 7890"},
-                        {"name": "Supervisor Khaled", "phone": "+966 50 567 8901"}
-                    ]
-                },
-                {
-                    "id": "PROJ-004",
-                    "name": "Diriyah Gate",
-                    "locations": ["Heritage Site", "Museum", "Parking Area"],
-                    "responsiblePersons": [
-                        {"name": "Eng. Faisal"},
-                        {"name": "Safety Manager Tom", "phone": "+966 50 678 9012"}
-                    ]
-                },
-                {
-                    "id": "PROJ-005",
-                    "name": "NEOM The Line",
-                    "locations": ["Module 42", "Spine Layer", "Logistics Hub"],
-                    "responsiblePersons": [
-                        {"name": "Director James", "phone": "+966 50 789 0123"},
-                        {"name": "Lead Eng. Sam"}
-                    ]
+    def get_many(self, config_types: List[str]) -> Dict[str, List[Any]]:
+        """
+        Get options for several config types in a single BatchGetItem.
+        Returns a dict keyed by the requested type names; cached types are
+        served from memory and missing rows fall back to defaults.
+        """
+        now = time.monotonic()
+        result: Dict[str, List[Any]] = {}
+        pending: Dict[str, List[str]] = {}
+        for config_type in config_types:
+            cache_key = config_type.upper()
+            cached = _CONFIG_CACHE.get((self.table_name, cache_key))
+            if cached and now - cached[0] < _CONFIG_TTL:
+                result[config_type] = _thaw(cached[1])
+            else:
+                pending.setdefault(cache_key, []).append(config_type)
+
+        if not pending:
+            return result
+
+        try:
+            fetched: Dict[str, List[Any]] = {}
+            request = {
+                self.table_name: {
+                    "Keys": [{"PK": "CONFIG", "SK": key} for key in pending]
                 }
-            ]
+            }
+            for attempt in range(_BATCH_GET_MAX_ATTEMPTS):
+                if attempt:
+                    # UnprocessedKeys means throttling; back off before retrying
+                    time.sleep(_BATCH_GET_BASE_DELAY * (2 ** (attempt - 1)))
+                response = self.dynamodb.batch_get_item(RequestItems=request)
+                for item in response.get("Responses", {}).get(self.table_name, []):
+                    if "values" in item:
+                        fetched[item["SK"]] = item["values"]
+                request = response.get("UnprocessedKeys")
+                if not request:
+                    break
+        except ClientError as e:
+            print(f"Error fetching configs {list(pending)}: {e}")
+            for cache_key, names in pending.items():
+                for name in names:
+                    result[name] = self._get_defaults(cache_key)
+            return result
+
+        # Keys still unprocessed after the last attempt get defaults for this
+        # call only, so the next lookup retries them instead of caching defaults
+        unprocessed = {
+            key["SK"] for key in (request or {}).get(self.table_name, {}).get("Keys", [])
         }
-        return defaults.get(config_type.upper(), [])
+        if unprocessed:
+            print(f"Config types still unprocessed after retries: {sorted(unprocessed)}")
+
+        fetched_at = time.monotonic()
+        for cache_key, names in pending.items():
+            values = fetched.get(cache_key)
+            if values is None:
+                values = self._get_defaults(cache_key)
+            frozen = _freeze(values)
+            if cache_key not in unprocessed:
+                _CONFIG_CACHE[(self.table_name, cache_key)] = (fetched_at, frozen)
+            for name in names:
+                result[name] = _thaw(frozen)
+        return result
+
+    def invalidate(self, config_type: str) -> None:
+        """Drop the cached options for a config type after it is updated."""
+        _CONFIG_CACHE.pop((self.table_name, config_type.upper()), None)
+
+    @staticmethod
+    def _get_defaults(config_type: str) -> List[str]:
+        """Return hardcoded defaults if DB is empty."""
+        return _thaw(_DEFAULTS.get(config_type.upper(), ()))
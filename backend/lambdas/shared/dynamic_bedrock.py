@@ -2,9 +2,54 @@
 
 import json
 import os
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import boto3
+from botocore.config import Config
+
+# Retry throttling and transient 5xx errors with exponential backoff; adaptive
+# mode also rate-limits client-side once Bedrock starts throttling. The cached
+# per-region clients keep their TLS connections alive across warm invocations.
+_BEDROCK_CLIENT_CONFIG = Config(
+    retries={"max_attempts": 5, "mode": "adaptive"},
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=300,
+)
+
+# Request bodies have a fixed shape, so they are rendered from prebuilt
+# templates rather than building a dict and serialising it on every call.
+_CLAUDE_BODY = (
+    '{"anthropic_version":"bedrock-2023-05-31","max_tokens":%d,'
+    '"temperature":%s,"messages":[{"role":"user","content":%s}]}'
+)
+_LLAMA_BODY = '{"prompt":%s,"max_gen_len":%d,"temperature":%s,"top_p":%s}'
+_TITAN_BODY = (
+    '{"inputText":%s,"textGenerationConfig":'
+    '{"maxTokenCount":%d,"temperature":%s,"topP":%s}}'
+)
+_NOVA_BODY = (
+    '{"messages":[{"role":"user","content":[{"text":%s}]}],'
+    '"inferenceConfig":{"max_new_tokens":%d,"temperature":%s,"top_p":%s}}'
+)
+_PROMPT_BODY = '{"prompt":%s,"max_tokens":%d,"temperature":%s,"top_p":%s}'
+_AI21_BODY = '{"prompt":%s,"maxTokens":%d,"temperature":%s,"topP":%s}'
+_COHERE_BODY = '{"message":%s,"max_tokens":%d,"temperature":%s,"p":%s}'
+_CHAT_BODY = (
+    '{"messages":[{"role":"user","content":%s}],'
+    '"max_tokens":%d,"temperature":%s,"top_p":%s}'
+)
+
+
+def _render(template: str, text: str, params: Dict) -> str:
+    """Fill a (text, max_tokens, temperature, top_p) body template."""
+    return template % (
+        json.dumps(text),
+        params["max_tokens"],
+        json.dumps(params["temperature"]),
+        json.dumps(params["top_p"]),
+    )
 
 
 class DynamicBedrockClient:
@@ -60,16 +105,41 @@ class DynamicBedrockClient:
         },
     }
 
-    ALLOWED_REGIONS = {"us-east-1", "eu-central-1", "me-central-1"}
+    # Flattened (model_id, region) -> effective ID view of the map above
+    _EFFECTIVE_MODEL_IDS: Dict[Tuple[str, str], str] = {
+        (model_id, region): profile_id
+        for model_id, regions in INFERENCE_PROFILE_MAP.items()
+        for region, profile_id in regions.items()
+    }
+
+    ALLOWED_REGIONS = frozenset({"us-east-1", "eu-central-1", "me-central-1"})
 
     def __init__(self):
         self.default_region = os.environ.get("AWS_REGION", "us-east-1")
         self.clients: Dict[str, object] = {}
+        # Region inputs are fixed for the life of the container, so resolve
+        # them once and memoise the per-model result.
+        self._current_region = os.environ.get("AWS_REGION")
+        self._region_overrides = self._load_region_overrides()
+        self._model_regions: Dict[str, str] = {}
+
+    @staticmethod
+    def _load_region_overrides() -> Dict[str, str]:
+        overrides = os.environ.get("BEDROCK_MODEL_REGION_OVERRIDES")
+        if not overrides:
+            return {}
+        try:
+            return json.loads(overrides)
+        except Exception as error:
+            print(f"Failed to parse BEDROCK_MODEL_REGION_OVERRIDES: {error}")
+            return {}
 
     def _get_client(self, region: str):
         if region not in self.clients:
             self.clients[region] = boto3.client(
-                "bedrock-runtime", region_name=region or self.default_region
+                "bedrock-runtime",
+                region_name=region or self.default_region,
+                config=_BEDROCK_CLIENT_CONFIG,
             )
         return self.clients[region]
 
@@ -78,87 +148,56 @@ class DynamicBedrockClient:
         Determine the AWS region to use for a given model.
         Prioritizes current region if supported, else falls back to Allowed Regions.
         """
-        overrides = os.environ.get("BEDROCK_MODEL_REGION_OVERRIDES")
-        if overrides:
-            try:
-                override_map = json.loads(overrides)
-                if model_id in override_map:
-                    return override_map[model_id]
-            except Exception as error:
-                print(f"Failed to parse BEDROCK_MODEL_REGION_OVERRIDES: {error}")
+        region = self._model_regions.get(model_id)
+        if region is None:
+            region = self._resolve_model_region(model_id)
+            self._model_regions[model_id] = region
+        return region
+
+    def _resolve_model_region(self, model_id: str) -> str:
+        if model_id in self._region_overrides:
+            return self._region_overrides[model_id]
 
         # If current region is in ALLOWED_REGIONS, prefer it
-        current_region = os.environ.get("AWS_REGION")
-        if current_region in self.ALLOWED_REGIONS:
-            return current_region
+        if self._current_region in self.ALLOWED_REGIONS:
+            return self._current_region
 
         # Fallback logic: Pick first allowed region that supports the model (heuristically)
         # For Nova models, we know they work in all 3 allowed regions (via single or profile)
         # So we default to us-east-1 if current is not allowed
         return "us-east-1"
 
-    def _get_effective_model_id(self, model_id: str, region: str) -> str:
+    @classmethod
+    def _get_effective_model_id(cls, model_id: str, region: str) -> str:
         """
         Resolve the model ID to an Inference Profile ID if required by the region.
         """
-        if model_id in self.INFERENCE_PROFILE_MAP:
-            profile_map = self.INFERENCE_PROFILE_MAP[model_id]
-            if region in profile_map:
-                return profile_map[region]
-        return model_id
+        return cls._EFFECTIVE_MODEL_IDS.get((model_id, region), model_id)
 
     def _invoke_claude(self, *, message: str, model_id: str, region: str, params: Dict):
-        body = json.dumps(
-            {
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": params["max_tokens"],
-                "temperature": params["temperature"],
-                "messages": [{"role": "user", "content": message}],
-            }
+        body = _CLAUDE_BODY % (
+            params["max_tokens"],
+            json.dumps(params["temperature"]),
+            json.dumps(message),
         )
         response = self._get_client(region).invoke_model(modelId=model_id, body=body)
         payload = json.loads(response["body"].read())
         return payload["content"][0]["text"]
 
     def _invoke_llama(self, *, message: str, model_id: str, region: str, params: Dict):
-        body = json.dumps(
-            {
-                "prompt": message,
-                "max_gen_len": params["max_tokens"],
-                "temperature": params["temperature"],
-                "top_p": params["top_p"],
-            }
-        )
+        body = _render(_LLAMA_BODY, message, params)
         response = self._get_client(region).invoke_model(modelId=model_id, body=body)
         payload = json.loads(response["body"].read())
         return payload["generation"]
 
     def _invoke_titan(self, *, message: str, model_id: str, region: str, params: Dict):
-        body = json.dumps(
-            {
-                "inputText": message,
-                "textGenerationConfig": {
-                    "maxTokenCount": params["max_tokens"],
-                    "temperature": params["temperature"],
-                    "topP": params["top_p"],
-                },
-            }
-        )
+        body = _render(_TITAN_BODY, message, params)
         response = self._get_client(region).invoke_model(modelId=model_id, body=body)
         payload = json.loads(response["body"].read())
         return payload["results"][0]["outputText"]
 
     def _invoke_nova(self, *, message: str, model_id: str, region: str, params: Dict):
-        body = json.dumps(
-            {
-                "messages": [{"role": "user", "content": [{"text": message}]}],
-                "inferenceConfig": {
-                    "max_new_tokens": params["max_tokens"],
-                    "temperature": params["temperature"],
-                    "top_p": params["top_p"],
-                },
-            }
-        )
+        body = _render(_NOVA_BODY, message, params)
         response = self._get_client(region).invoke_model(modelId=model_id, body=body)
         payload = json.loads(response["body"].read())
         return payload["output"]["message"]["content"][0]["text"]
@@ -166,68 +205,33 @@ class DynamicBedrockClient:
     def _invoke_mistral(
         self, *, message: str, model_id: str, region: str, params: Dict
     ):
-        body = json.dumps(
-            {
-                "prompt": f"<s>[INST] {message} [/INST]",
-                "max_tokens": params["max_tokens"],
-                "temperature": params["temperature"],
-                "top_p": params["top_p"],
-            }
-        )
+        body = _render(_PROMPT_BODY, f"<s>[INST] {message} [/INST]", params)
         response = self._get_client(region).invoke_model(modelId=model_id, body=body)
         payload = json.loads(response["body"].read())
         return payload["outputs"][0]["text"]
 
     def _invoke_ai21(self, *, message: str, model_id: str, region: str, params: Dict):
         if "jamba" in model_id.lower():
-            body = json.dumps(
-                {
-                    "messages": [{"role": "user", "content": message}],
-                    "max_tokens": params["max_tokens"],
-                    "temperature": params["temperature"],
-                    "top_p": params["top_p"],
-                }
-            )
+            body = _render(_CHAT_BODY, message, params)
             response = self._get_client(region).invoke_model(
                 modelId=model_id, body=body
             )
             payload = json.loads(response["body"].read())
             return payload["choices"][0]["message"]["content"]
 
-        body = json.dumps(
-            {
-                "prompt": message,
-                "maxTokens": params["max_tokens"],
-                "temperature": params["temperature"],
-                "topP": params["top_p"],
-            }
-        )
+        body = _render(_AI21_BODY, message, params)
         response = self._get_client(region).invoke_model(modelId=model_id, body=body)
         payload = json.loads(response["body"].read())
         return payload["completions"][0]["data"]["text"]
 
     def _invoke_cohere(self, *, message: str, model_id: str, region: str, params: Dict):
-        body = json.dumps(
-            {
-                "message": message,
-                "max_tokens": params["max_tokens"],
-                "temperature": params["temperature"],
-                "p": params["top_p"],
-            }
-        )
+        body = _render(_COHERE_BODY, message, params)
         response = self._get_client(region).invoke_model(modelId=model_id, body=body)
         payload = json.loads(response["body"].read())
         return payload["text"]
 
     def _invoke_openai(self, *, message: str, model_id: str, region: str, params: Dict):
-        body = json.dumps(
-            {
-                "messages": [{"role": "user", "content": message}],
-                "max_tokens": params["max_tokens"],
-                "temperature": params["temperature"],
-                "top_p": params["top_p"],
-            }
-        )
+        body = _render(_CHAT_BODY, message, params)
         response = self._get_client(region).invoke_model(modelId=model_id, body=body)
         payload = json.loads(response["body"].read())
         return payload["choices"][0]["message"]["content"]
@@ -235,27 +239,13 @@ class DynamicBedrockClient:
     def _invoke_deepseek(
         self, *, message: str, model_id: str, region: str, params: Dict
     ):
-        body = json.dumps(
-            {
-                "messages": [{"role": "user", "content": message}],
-                "max_tokens": params["max_tokens"],
-                "temperature": params["temperature"],
-                "top_p": params["top_p"],
-            }
-        )
+        body = _render(_CHAT_BODY, message, params)
         response = self._get_client(region).invoke_model(modelId=model_id, body=body)
         payload = json.loads(response["body"].read())
         return payload["choices"][0]["message"]["content"]
 
     def _invoke_qwen(self, *, message: str, model_id: str, region: str, params: Dict):
-        body = json.dumps(
-            {
-                "messages": [{"role": "user", "content": message}],
-                "max_tokens": params["max_tokens"],
-                "temperature": params["temperature"],
-                "top_p": params["top_p"],
-            }
-        )
+        body = _render(_CHAT_BODY, message, params)
         response = self._get_client(region).invoke_model(modelId=model_id, body=body)
         payload = json.loads(response["body"].read())
         return payload["choices"][0]["message"]["content"]
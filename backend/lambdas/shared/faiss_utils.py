@@ -4,6 +4,7 @@ import json
 import os
 import pickle
 import tempfile
+import time
 from typing import Any, Dict, List, Tuple
 
 import boto3
@@ -41,7 +42,6 @@ class FAISSService:
                 payload = json.loads(response["body"].read())
                 return payload.get("embedding", [])
             except Exception as e:
-                import time
                 error_code = getattr(e, "response", {}).get("Error", {}).get("Code", "")
                 if attempt < max_retries - 1 and error_code in [
                     "ThrottlingException",
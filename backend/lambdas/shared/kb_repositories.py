@@ -6,6 +6,11 @@ from typing import Any, Dict, List, Optional
 
 import boto3
 from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeDeserializer
+
+from .aws_clients import get_dynamodb_client
+
+_deserializer = TypeDeserializer()
 
 
 class KnowledgeBaseRepository:
@@ -19,7 +24,10 @@ class KnowledgeBaseRepository:
         if not table_name:
             raise ValueError("KB_TABLE_NAME environment variable is required")
 
+        self.table_name = table_name
         self.table = boto3.resource("dynamodb").Table(table_name)
+        # Low-level client for hot write paths: skips TypeSerializer tree-walks
+        self._client = get_dynamodb_client()
 
     def update_index_lock(
         self, *, kb_id: str, user_id: str, lock_id: str, ttl_seconds: int = 300
@@ -30,8 +38,9 @@ class KnowledgeBaseRepository:
         """
         timestamp = int(time.time() * 1000)
         try:
-            self.table.update_item(
-                Key={"userId": user_id, "kbId": kb_id},
+            self._client.update_item(
+                TableName=self.table_name,
+                Key={"userId": {"S": user_id}, "kbId": {"S": kb_id}},
                 UpdateExpression="SET indexLock = :lock, indexLockTime = :time",
                 ConditionExpression=(
                     "attribute_not_exists(indexLock) OR "
@@ -39,10 +48,10 @@ class KnowledgeBaseRepository:
                     "indexLockTime < :expiry"
                 ),
                 ExpressionAttributeValues={
-                    ":lock": lock_id,
-                    ":time": timestamp,
-                    ":empty": "",
-                    ":expiry": timestamp - (ttl_seconds * 1000),
+                    ":lock": {"S": lock_id},
+                    ":time": {"N": str(timestamp)},
+                    ":empty": {"S": ""},
+                    ":expiry": {"N": str(timestamp - (ttl_seconds * 1000))},
                 },
             )
             return True
@@ -52,11 +61,12 @@ class KnowledgeBaseRepository:
     def release_index_lock(self, *, kb_id: str, user_id: str, lock_id: str):
         """Release the KB index lock."""
         try:
-            self.table.update_item(
-                Key={"userId": user_id, "kbId": kb_id},
+            self._client.update_item(
+                TableName=self.table_name,
+                Key={"userId": {"S": user_id}, "kbId": {"S": kb_id}},
                 UpdateExpression="REMOVE indexLock, indexLockTime",
                 ConditionExpression="indexLock = :lock",
-                ExpressionAttributeValues={":lock": lock_id},
+                ExpressionAttributeValues={":lock": {"S": lock_id}},
             )
         except Exception:
             pass
@@ -152,28 +162,30 @@ class KnowledgeBaseRepository:
             return False
 
     def increment_document_stats(self, *, user_id: str, kb_id: str, size: int):
-        self.table.update_item(
-            Key={"userId": user_id, "kbId": kb_id},
+        self._client.update_item(
+            TableName=self.table_name,
+            Key={"userId": {"S": user_id}, "kbId": {"S": kb_id}},
             UpdateExpression=(
                 "ADD documentCount :inc, totalSize :size SET updatedAt = :timestamp"
             ),
             ExpressionAttributeValues={
-                ":inc": 1,
-                ":size": size,
-                ":timestamp": int(time.time() * 1000),
+                ":inc": {"N": "1"},
+                ":size": {"N": str(size)},
+                ":timestamp": {"N": str(int(time.time() * 1000))},
             },
         )
 
     def decrement_document_stats(self, *, user_id: str, kb_id: str, size: int):
-        self.table.update_item(
-            Key={"userId": user_id, "kbId": kb_id},
+        self._client.update_item(
+            TableName=self.table_name,
+            Key={"userId": {"S": user_id}, "kbId": {"S": kb_id}},
             UpdateExpression=(
                 "ADD documentCount :dec, totalSize :size SET updatedAt = :timestamp"
             ),
             ExpressionAttributeValues={
-                ":dec": -1,
-                ":size": -size,
-                ":timestamp": int(time.time() * 1000),
+                ":dec": {"N": "-1"},
+                ":size": {"N": str(-size)},
+                ":timestamp": {"N": str(int(time.time() * 1000))},
             },
         )
 
@@ -188,7 +200,10 @@ class DocumentRepository:
         if not table_name:
             raise ValueError("DOCS_TABLE_NAME environment variable is required")
 
+        self.table_name = table_name
         self.table = boto3.resource("dynamodb").Table(table_name)
+        # Low-level client for hot write paths: skips TypeSerializer tree-walks
+        self._client = get_dynamodb_client()
 
     def create(
         self,
@@ -266,8 +281,9 @@ class DocumentRepository:
         """
         timestamp = int(time.time() * 1000)
         try:
-            self.table.update_item(
-                Key={"userId": user_id, "kbId": kb_id},
+            self._client.update_item(
+                TableName=self.table_name,
+                Key={"userId": {"S": user_id}, "kbId": {"S": kb_id}},
                 UpdateExpression="SET indexLock = :lock, indexLockTime = :time",
                 ConditionExpression=(
                     "attribute_not_exists(indexLock) OR "
@@ -275,10 +291,10 @@ class DocumentRepository:
                     "indexLockTime < :expiry"
                 ),
                 ExpressionAttributeValues={
-                    ":lock": lock_id,
-                    ":time": timestamp,
-                    ":empty": "",
-                    ":expiry": timestamp - (ttl_seconds * 1000),
+                    ":lock": {"S": lock_id},
+                    ":time": {"N": str(timestamp)},
+                    ":empty": {"S": ""},
+                    ":expiry": {"N": str(timestamp - (ttl_seconds * 1000))},
                 },
             )
             return True
@@ -288,11 +304,12 @@ class DocumentRepository:
     def release_index_lock(self, *, kb_id: str, user_id: str, lock_id: str):
         """Release the KB index lock."""
         try:
-            self.table.update_item(
-                Key={"userId": user_id, "kbId": kb_id},
+            self._client.update_item(
+                TableName=self.table_name,
+                Key={"userId": {"S": user_id}, "kbId": {"S": kb_id}},
                 UpdateExpression="REMOVE indexLock, indexLockTime",
                 ConditionExpression="indexLock = :lock",
-                ExpressionAttributeValues={":lock": lock_id},
+                ExpressionAttributeValues={":lock": {"S": lock_id}},
             )
         except Exception:
             pass
@@ -312,70 +329,87 @@ class DocumentRepository:
         update_expression = "SET #status = :status, processedAt = :timestamp"
         expression_attribute_names = {"#status": "status"}
         expression_attribute_values: Dict[str, Any] = {
-            ":status": status,
-            ":timestamp": timestamp,
+            ":status": {"S": status},
+            ":timestamp": {"N": str(timestamp)},
         }
 
         if chunk_count > 0:
             update_expression += ", chunkCount = :chunk_count"
-            expression_attribute_values[":chunk_count"] = chunk_count
+            expression_attribute_values[":chunk_count"] = {"N": str(chunk_count)}
 
         if extraction_method:
             update_expression += ", extractionMethod = :extraction_method"
-            expression_attribute_values[":extraction_method"] = extraction_method
+            expression_attribute_values[":extraction_method"] = {
+                "S": extraction_method
+            }
 
         if error_message:
             update_expression += ", errorMessage = :error"
-            expression_attribute_values[":error"] = error_message
+            expression_attribute_values[":error"] = {"S": error_message}
 
-        response = self.table.update_item(
-            Key={"kbId": kb_id, "documentId": document_id},
+        response = self._client.update_item(
+            TableName=self.table_name,
+            Key={"kbId": {"S": kb_id}, "documentId": {"S": document_id}},
             UpdateExpression=update_expression,
             ExpressionAttributeNames=expression_attribute_names,
             ExpressionAttributeValues=expression_attribute_values,
             ReturnValues="ALL_NEW",
         )
-        return response.get("Attributes", {})
+        return {
+            key: _deserializer.deserialize(value)
+            for key, value in response.get("Attributes", {}).items()
+        }
 
-    def update_index_lock(
-        self, *, kb_id: str, user_id: str, lock_id: str, ttl_seconds: int = 300
-    ) -> bool:
+    def update_status_and_stats(
+        self,
+        *,
+        kb_id: str,
+        document_id: str,
+        status: str,
+        kb_table_name: str,
+        owner_id: str,
+        size_delta: int,
+        count_delta: int = 1,
+    ):
         """
-        Acquire a lock for updating the KB index.
-        Returns True if lock acquired, False otherwise.
+        Set a document's status and adjust the parent KB's document stats.
+        Both rows are written in a single transaction (one round-trip);
+        kb_table_name is the KnowledgeBaseRepository's table.
         """
-        timestamp = int(time.time() * 1000)
-        try:
-            self.table.update_item(
-                Key={"userId": user_id, "kbId": kb_id},
-                UpdateExpression="SET indexLock = :lock, indexLockTime = :time",
-                ConditionExpression=(
-                    "attribute_not_exists(indexLock) OR "
-                    "indexLock = :empty OR "
-                    "indexLockTime < :expiry"
-                ),
-                ExpressionAttributeValues={
-                    ":lock": lock_id,
-                    ":time": timestamp,
-                    ":empty": "",
-                    ":expiry": timestamp - (ttl_seconds * 1000),
+        timestamp = {"N": str(int(time.time() * 1000))}
+        self._client.transact_write_items(
+            TransactItems=[
+                {
+                    "Update": {
+                        "TableName": self.table_name,
+                        "Key": {"kbId": {"S": kb_id}, "documentId": {"S": document_id}},
+                        "UpdateExpression": (
+                            "SET #status = :status, processedAt = :timestamp"
+                        ),
+                        "ExpressionAttributeNames": {"#status": "status"},
+                        "ExpressionAttributeValues": {
+                            ":status": {"S": status},
+                            ":timestamp": timestamp,
+                        },
+                    }
                 },
-            )
-            return True
-        except Exception:
-            return False
-
-    def release_index_lock(self, *, kb_id: str, user_id: str, lock_id: str):
-        """Release the KB index lock."""
-        try:
-            self.table.update_item(
-                Key={"userId": user_id, "kbId": kb_id},
-                UpdateExpression="REMOVE indexLock, indexLockTime",
-                ConditionExpression="indexLock = :lock",
-                ExpressionAttributeValues={":lock": lock_id},
-            )
-        except Exception:
-            pass
+                {
+                    "Update": {
+                        "TableName": kb_table_name,
+                        "Key": {"userId": {"S": owner_id}, "kbId": {"S": kb_id}},
+                        "UpdateExpression": (
+                            "ADD documentCount :inc, totalSize :size "
+                            "SET updatedAt = :timestamp"
+                        ),
+                        "ExpressionAttributeValues": {
+                            ":inc": {"N": str(count_delta)},
+                            ":size": {"N": str(size_delta)},
+                            ":timestamp": timestamp,
+                        },
+                    }
+                },
+            ]
+        )
 
     def delete(self, *, kb_id: str, document_id: str) -> bool:
         try:
@@ -1,21 +1,24 @@
 import json
 import os
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 from decimal import Decimal
-import boto3
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; fall back to stdlib json
+    orjson = None
+
+from .aws_clients import get_dynamodb_resource, get_s3_client, get_table
 
 # Lazy initialization of DynamoDB table to avoid import-time failures
-_dynamodb = None
 _table = None
 _table_name = None
 
 
 def _get_dynamodb():
     """Get or create DynamoDB resource (lazy initialization)."""
-    global _dynamodb
-    if _dynamodb is None:
-        _dynamodb = boto3.resource("dynamodb")
-    return _dynamodb
+    return get_dynamodb_resource()
 
 
 def _get_table():
@@ -23,7 +26,7 @@ def _get_table():
     global _table, _table_name
     if _table is None:
         _table_name = os.environ.get("DYNAMODB_TABLE_NAME", "taskflow-table")
-        _table = _get_dynamodb().Table(_table_name)
+        _table = get_table(_table_name)
     return _table
 
 
@@ -37,65 +40,45 @@ class _LazyTable:
 
 table = _LazyTable()
 
-# Lazy initialization of S3 client for shared use
-_s3_client = None
-
-
-def get_s3_client():
-    """Get or create S3 client (lazy initialization)."""
-    global _s3_client
-    if _s3_client is None:
-        _s3_client = boto3.client("s3")
-    return _s3_client
-
 
-class DecimalEncoder(json.JSONEncoder):
-    """Custom JSON encoder that handles Decimal objects from DynamoDB."""
+# Read-only template; every response gets its own copy it may modify.
+_DEFAULT_HEADERS = MappingProxyType({
+    "Content-Type": "application/json",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token",
+    "Access-Control-Allow-Methods": "GET,POST,PUT,DELETE,OPTIONS",
+})
 
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            # Convert Decimal to int if it's a whole number, otherwise float
-            if obj % 1 == 0:
-                return int(obj)
-            return float(obj)
-        return super().default(obj)
 
-
-def _convert_decimals(obj):
-    """Recursively convert Decimal objects to int or float."""
+def _json_default(obj):
+    """Serialize Decimal objects from DynamoDB during json.dumps."""
     if isinstance(obj, Decimal):
         # Convert Decimal to int if it's a whole number, otherwise float
         if obj % 1 == 0:
             return int(obj)
         return float(obj)
-    elif isinstance(obj, dict):
-        return {key: _convert_decimals(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [_convert_decimals(item) for item in obj]
-    return obj
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def create_response(
     status_code: int, body: Any, headers: Optional[Dict[str, str]] = None
 ) -> Dict[str, Any]:
     """Create a standardized API Gateway response."""
-    default_headers = {
-        "Content-Type": "application/json",
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token",
-        "Access-Control-Allow-Methods": "GET,POST,PUT,DELETE,OPTIONS",
-    }
-
-    if headers:
-        default_headers.update(headers)
+    response_headers = (
+        {**_DEFAULT_HEADERS, **headers} if headers else dict(_DEFAULT_HEADERS)
+    )
 
-    # Convert Decimal objects to JSON-serializable types
-    body = _convert_decimals(body)
+    if orjson is not None:
+        serialized = orjson.dumps(
+            body, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+    else:
+        serialized = json.dumps(body, default=_json_default, separators=(",", ":"))
 
     return {
         "statusCode": status_code,
-        "headers": default_headers,
-        "body": json.dumps(body, cls=DecimalEncoder),
+        "headers": response_headers,
+        "body": serialized,
     }
 
 
@@ -148,7 +131,12 @@ def validate_required_fields(
 ) -> Dict[str, Any]:
     """Validate that required fields are present in the request body."""
     missing_fields = [field for field in required_fields if not body.get(field)]
-    return {"is_valid": len(missing_fields) == 0, "missing_fields": missing_fields}
+    return {"is_valid": not missing_fields, "missing_fields": missing_fields}
+
+
+def has_required_fields(body: Dict[str, Any], required_fields: list) -> bool:
+    """Return True if all required fields are present; stops at the first gap."""
+    return all(body.get(field) for field in required_fields)
 
 
 def with_error_handling(func):
@@ -3,8 +3,52 @@
 import os
 from datetime import datetime
 from typing import Dict, Any
-import boto3
-import requests
+
+from .aws_clients import get_s3_client
+from .http_pool import HTTP, basic_auth_headers, raise_for_status
+from .twilio_credentials import get_twilio_credentials
+
+_EXT_BY_CT = {
+    "image/jpeg": ".jpg",
+    "image/jpg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+}
+
+_transfer_config = None
+
+
+def _get_transfer_config():
+    """Multipart above 5 MB so large media is uploaded while still downloading."""
+    global _transfer_config
+    if _transfer_config is None:
+        from boto3.s3.transfer import TransferConfig
+
+        _transfer_config = TransferConfig(
+            multipart_threshold=5 * 1024 * 1024, use_threads=True
+        )
+    return _transfer_config
+
+
+def _to_ascii(value: str) -> str:
+    """Drop non-ASCII characters; ASCII strings are returned unchanged."""
+    if value.isascii():
+        return value
+    return value.encode("ascii", "ignore").decode("ascii")
+
+
+class _CountingReader:
+    """File-like wrapper that counts bytes read from a stream."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self.bytes_read = 0
+
+    def read(self, amt=None):
+        chunk = self._stream.read(amt)
+        self.bytes_read += len(chunk)
+        return chunk
 
 
 class S3Client:
@@ -12,7 +56,7 @@ class S3Client:
 
     def __init__(self):
         """Initialize S3 client."""
-        self.s3_client = boto3.client("s3")
+        self.s3_client = get_s3_client()
         self.bucket_name = os.environ.get("REPORTS_BUCKET", "mabani-reports-dev")
         self.region = os.environ.get("AWS_REGION", "eu-west-1")
 
@@ -32,24 +76,8 @@ class S3Client:
         """
         try:
             # Get Twilio credentials for authenticated download from Parameter Store
-            ssm_client = boto3.client("ssm")
-            parameter_path = os.environ.get("TWILIO_PARAMETER_PATH", "/mabani/twilio")
-
             try:
-                response_params = ssm_client.get_parameters_by_path(
-                    Path=parameter_path,
-                    Recursive=True,
-                    WithDecryption=True,
-                )
-
-                parameters = response_params.get("Parameters", [])
-
-                # Convert parameters to dictionary
-                credentials = {}
-                for param in parameters:
-                    key = param["Name"].split("/")[-1]
-                    credentials[key] = param["Value"]
-
+                credentials = get_twilio_credentials()
                 account_sid = credentials.get("account_sid")
                 auth_token = credentials.get("auth_token")
             except Exception as e:
@@ -61,41 +89,46 @@ class S3Client:
 
             # Download image from Twilio with authentication
             if account_sid and auth_token:
-                from requests.auth import HTTPBasicAuth
-
-                response = requests.get(
-                    image_url, timeout=30, auth=HTTPBasicAuth(account_sid, auth_token)
-                )
+                headers = basic_auth_headers(account_sid, auth_token)
             else:
                 # Try without auth (may fail)
-                response = requests.get(image_url, timeout=30)
-
-            response.raise_for_status()
-            image_data = response.content
-
-            # Determine file extension from content type
-            content_type = response.headers.get("Content-Type", "image/jpeg")
-            extension = self._get_extension_from_content_type(content_type)
-
-            # Create S3 key with organized structure
-            now = datetime.utcnow()
-            s3_key = f"images/{now.year}/{now.month:02d}/{request_id}{extension}"
-
-            # Sanitize metadata to ensure ASCII compliance (S3 requirement)
-            sanitized_metadata = {}
-            for k, v in metadata.items():
-                if v:
-                    # Replace non-ascii characters with equivalent or question mark
-                    sanitized_metadata[k] = str(v).encode("ascii", "ignore").decode("ascii")
-
-            # Upload to S3
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=image_data,
-                ContentType=content_type,
-                Metadata=sanitized_metadata,
+                headers = None
+
+            response = HTTP.request(
+                "GET", image_url, headers=headers, timeout=30, preload_content=False
             )
+            try:
+                raise_for_status(response)
+
+                # Determine file extension from content type
+                content_type = response.headers.get("Content-Type", "image/jpeg")
+                # Drop parameters such as "; charset=binary" before the lookup
+                mime_type = content_type.split(";", 1)[0].strip().lower()
+                extension = _EXT_BY_CT.get(mime_type, ".jpg")
+
+                # Create S3 key with organized structure
+                now = datetime.utcnow()
+                s3_key = f"images/{now.year}/{now.month:02d}/{request_id}{extension}"
+
+                # Sanitize metadata to ensure ASCII compliance (S3 requirement)
+                sanitized_metadata = {
+                    k: _to_ascii(str(v)) for k, v in metadata.items() if v
+                }
+
+                # Stream the download straight into S3
+                reader = _CountingReader(response)
+                self.s3_client.upload_fileobj(
+                    reader,
+                    Bucket=self.bucket_name,
+                    Key=s3_key,
+                    ExtraArgs={
+                        "ContentType": content_type,
+                        "Metadata": sanitized_metadata,
+                    },
+                    Config=_get_transfer_config(),
+                )
+            finally:
+                response.release_conn()
 
             # Generate URLs
             s3_url = f"s3://{self.bucket_name}/{s3_key}"
@@ -108,7 +141,7 @@ class S3Client:
                 "s3Key": s3_key,
                 "s3Url": s3_url,
                 "httpsUrl": https_url,
-                "size": len(image_data),
+                "size": reader.bytes_read,
                 "contentType": content_type,
             }
 
@@ -132,22 +165,3 @@ class S3Client:
         except Exception as error:
             print(f"Error downloading image from S3: {error}")
             raise
-
-    def _get_extension_from_content_type(self, content_type: str) -> str:
-        """
-        Get file extension from content type.
-
-        Args:
-            content_type: MIME type
-
-        Returns:
-            File extension with dot
-        """
-        extensions = {
-            "image/jpeg": ".jpg",
-            "image/jpg": ".jpg",
-            "image/png": ".png",
-            "image/gif": ".gif",
-            "image/webp": ".webp",
-        }
-        return extensions.get(content_type, ".jpg")
@@ -0,0 +1,48 @@
+"""
+Twilio credentials loaded from AWS Systems Manager Parameter Store.
+Cached at module scope so every client in a warm container shares one fetch.
+"""
+
+import os
+import time
+from typing import Any, Dict
+
+from botocore.exceptions import ClientError
+
+from .aws_clients import get_ssm_client
+
+_CACHE: Dict[str, Any] = {"creds": None, "ts": 0.0}
+
+
+def get_twilio_credentials(ttl: int = 900) -> Dict[str, str]:
+    """
+    Return Twilio credentials (account_sid, auth_token, whatsapp_number, ...).
+    Parameters are re-read from Parameter Store once the cache is older than ttl seconds.
+    """
+    creds = _CACHE["creds"]
+    if creds and time.monotonic() - _CACHE["ts"] < ttl:
+        return creds
+
+    parameter_path = os.environ.get("TWILIO_PARAMETER_PATH", "/mabani/twilio")
+
+    try:
+        # Get all parameters under the path
+        response = get_ssm_client().get_parameters_by_path(
+            Path=parameter_path,
+            Recursive=True,
+            WithDecryption=True,  # Decrypt SecureString parameters
+        )
+    except ClientError as error:
+        print(f"Error retrieving Twilio credentials from Parameter Store: {error}")
+        raise
+
+    parameters = response.get("Parameters", [])
+    if not parameters:
+        raise ValueError(f"No parameters found at path: {parameter_path}")
+
+    # Extract the key name from the full path (e.g., /mabani/twilio/auth_token -> auth_token)
+    creds = {param["Name"].split("/")[-1]: param["Value"] for param in parameters}
+
+    _CACHE["creds"] = creds
+    _CACHE["ts"] = time.monotonic()
+    return creds
@@ -5,11 +5,35 @@ import tempfile
 from typing import Any, Dict, List, Tuple
 
 import boto3
+from botocore.exceptions import WaiterError
+from botocore.waiter import WaiterModel, create_waiter_with_client
 from PyPDF2 import PdfReader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 import tiktoken
 
 
+# botocore ships no Textract waiters, so define one for async text detection.
+# Polls every 2s for up to 10 minutes; only SUCCEEDED counts as success.
+_TEXTRACT_WAITER_NAME = "DocumentTextDetectionComplete"
+_TEXTRACT_WAITER_MODEL = WaiterModel(
+    {
+        "version": 2,
+        "waiters": {
+            _TEXTRACT_WAITER_NAME: {
+                "operation": "GetDocumentTextDetection",
+                "delay": 2,
+                "maxAttempts": 300,
+                "acceptors": [
+                    {"matcher": "path", "argument": "JobStatus", "expected": "SUCCEEDED", "state": "success"},
+                    {"matcher": "path", "argument": "JobStatus", "expected": "FAILED", "state": "failure"},
+                    {"matcher": "path", "argument": "JobStatus", "expected": "PARTIAL_SUCCESS", "state": "failure"},
+                ],
+            }
+        },
+    }
+)
+
+
 class DocumentProcessingService:
     """Process documents stored in S3 into text chunks."""
 
@@ -17,6 +41,7 @@ class DocumentProcessingService:
 
     def __init__(self):
         self.s3_client = boto3.client("s3")
+        self._textract_client = None
         self.bucket_name = os.environ.get("KB_BUCKET_NAME")
         if not self.bucket_name:
             raise ValueError("KB_BUCKET_NAME environment variable is required")
@@ -46,10 +71,16 @@ class DocumentProcessingService:
             return len(self.tokenizer.encode(text))
         return max(1, len(text) // 4)
 
+    def _get_textract_client(self):
+        """Create the Textract client on first use (only scanned PDFs need it)."""
+        if self._textract_client is None:
+            self._textract_client = boto3.client("textract")
+        return self._textract_client
+
     def _extract_text_with_textract(self, s3_key: str) -> str:
         """Fallback to AWS Textract for scanned documents."""
         print(f"Triggering Textract for {s3_key}")
-        textract_client = boto3.client("textract")
+        textract_client = self._get_textract_client()
         
         try:
             response = textract_client.start_document_text_detection(
@@ -61,45 +92,43 @@ class DocumentProcessingService:
             
             print(f"Started Textract Job: {job_id}")
             
-            # Poll for completion
-            import time
+            # Wait for completion
+            waiter = create_waiter_with_client(
+                _TEXTRACT_WAITER_NAME, _TEXTRACT_WAITER_MODEL, textract_client
+            )
+            try:
+                waiter.wait(JobId=job_id)
+            except WaiterError as e:
+                print(f"Textract failed: {e}")
+                return ""
+
+            text = ""
+            # Pagination
+            next_token = None
             while True:
-                response = textract_client.get_document_text_detection(JobId=job_id)
-                status = response["JobStatus"]
-                
-                if status in ["SUCCEEDED", "FAILED", "PARTIAL_SUCCESS"]:
+                if next_token:
+                    response = textract_client.get_document_text_detection(JobId=job_id, NextToken=next_token)
+                else:
+                    response = textract_client.get_document_text_detection(JobId=job_id)
+                    
+                for block in response["Blocks"]:
+                    if block["BlockType"] == "LINE":
+                        text += block["Text"] + "\n"
+                    elif block["BlockType"] == "PAGE":
+                        text += "\n\n## Page End ##\n\n"
+
+                next_token = response.get("NextToken")
+                if not next_token:
                     break
-                time.sleep(2)
-            
-            if status == "SUCCEEDED":
-                text = ""
-                # Pagination
-                next_token = None
-                while True:
-                    if next_token:
-                        response = textract_client.get_document_text_detection(JobId=job_id, NextToken=next_token)
-                    else:
-                        response = textract_client.get_document_text_detection(JobId=job_id)
-                        
-                    for block in response["Blocks"]:
-                        if block["BlockType"] == "LINE":
-                            text += block["Text"] + "\n"
-                        elif block["BlockType"] == "PAGE":
-                            text += "\n\n## Page End ##\n\n"
-
-                    next_token = response.get("NextToken")
-                    if not next_token:
-                        break
-                return text
-            else:
-                print(f"Textract failed with status: {status}")
-                return ""
+            return text
                 
         except Exception as e:
             print(f"Textract invocation failed: {e}")
             return ""
 
     def _extract_pdf(self, file_path: str, s3_key: str = None) -> Tuple[List[Dict[str, Any]], str]:
+        # One reader per call: downloads land in fresh temp paths, so a
+        # cross-invocation cache would never hit and would pin the parsed PDF
         reader = PdfReader(file_path)
         extracted_text = ""
         valid_text_count = 0
@@ -0,0 +1,128 @@
+"""
+Process-wide boto3 clients shared by the Lambda utilities.
+Clients are created lazily on first use and reused across warm invocations,
+so the connection pool (and its TLS sessions) survives between requests.
+boto3 itself is imported on first use, keeping it off the cold-start path of
+handlers (e.g. CORS preflights) that never touch AWS.
+"""
+
+import os
+import threading
+from typing import Any, Dict, Tuple
+
+# Re-entrant: the DAX fallback builds the plain resource while holding it
+_lock = threading.RLock()
+_client_config = None
+_dynamodb = None
+_dax = None
+_dynamodb_client = None
+_ssm_client = None
+_s3_client = None
+_tables: Dict[Tuple[str, bool], Any] = {}
+
+
+def get_client_config():
+    """Get the shared botocore Config (pool size, keep-alive, retries)."""
+    global _client_config
+    if _client_config is None:
+        from botocore.config import Config
+
+        _client_config = Config(
+            max_pool_connections=50,
+            tcp_keepalive=True,
+            retries={"max_attempts": 3, "mode": "adaptive"},
+        )
+    return _client_config
+
+
+def get_dynamodb_resource():
+    """Get or create the shared (plain DynamoDB) resource."""
+    global _dynamodb
+    if _dynamodb is None:
+        with _lock:
+            if _dynamodb is None:
+                import boto3
+
+                _dynamodb = boto3.resource("dynamodb", config=get_client_config())
+    return _dynamodb
+
+
+def get_dax_resource():
+    """
+    Get the resource for cache-friendly point reads. When DAX_ENDPOINT is set
+    and amazondax is installed this goes through the DAX cluster; otherwise it
+    is the plain DynamoDB resource. Only opt in for data that tolerates
+    eventually consistent item-cache reads (config, last project), never for
+    read-after-write state such as conversations.
+    """
+    global _dax
+    if _dax is None:
+        with _lock:
+            if _dax is None:
+                _dax = _create_dax_resource()
+    return _dax
+
+
+def _create_dax_resource():
+    dax_endpoint = os.environ.get("DAX_ENDPOINT")
+    if dax_endpoint:
+        try:
+            import amazondax
+        except ImportError:
+            print("DAX_ENDPOINT is set but amazondax is not installed; using DynamoDB")
+        else:
+            return amazondax.AmazonDaxClient.resource(
+                endpoint_url=dax_endpoint,
+                region_name=os.environ.get("AWS_REGION"),
+            )
+    return get_dynamodb_resource()
+
+
+def get_table(table_name: str, use_dax: bool = False):
+    """
+    Get a cached DynamoDB Table handle by name. use_dax=True reads through
+    get_dax_resource(); the default is always plain DynamoDB.
+    """
+    key = (table_name, use_dax)
+    table = _tables.get(key)
+    if table is None:
+        resource = get_dax_resource() if use_dax else get_dynamodb_resource()
+        table = resource.Table(table_name)
+        _tables[key] = table
+    return table
+
+
+def get_dynamodb_client():
+    """Get or create the shared low-level DynamoDB client."""
+    global _dynamodb_client
+    if _dynamodb_client is None:
+        with _lock:
+            if _dynamodb_client is None:
+                import boto3
+
+                _dynamodb_client = boto3.client("dynamodb", config=get_client_config())
+    return _dynamodb_client
+
+
+def get_ssm_client():
+    """Get or create the shared SSM client."""
+    global _ssm_client
+    if _ssm_client is None:
+        with _lock:
+            if _ssm_client is None:
+                import boto3
+
+                _ssm_client = boto3.client("ssm", config=get_client_config())
+    return _ssm_client
+
+
+def get_s3_client():
+    """Get or create the shared S3 client."""
+    global _s3_client
+    if _s3_client is None:
+        with _lock:
+            if _s3_client is None:
+                import boto3
+
+                _s3_client = boto3.client("s3", config=get_client_config())
+    return _s3_client
@@ -7,9 +7,10 @@ import os
 import json
 import time
 from typing import Dict, Any, Optional
-import boto3
 from botocore.exceptions import ClientError
 
+from .aws_clients import get_dynamodb_resource, get_table
+
 class ConversationState:
     """Manages the conversation state in DynamoDB."""
 
@@ -25,8 +26,8 @@ class ConversationState:
             # Fallback for local testing or if not set, though ideally should be set
             self.table_name = "taskflow-backend-dev-conversations"
             
-        self.dynamodb = boto3.resource("dynamodb")
-        self.table = self.dynamodb.Table(self.table_name)
+        self.dynamodb = get_dynamodb_resource()
+        self.table = get_table(self.table_name)
         # TTL: 24 hours in seconds
         self.ttl_seconds = 24 * 60 * 60
 
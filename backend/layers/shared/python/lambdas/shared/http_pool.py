@@ -0,0 +1,58 @@
+"""
+Process-wide urllib3 connection pool for outbound HTTP (Twilio API and media).
+Reusing one PoolManager keeps TLS connections open across warm invocations.
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+import urllib3
+
+HTTP = urllib3.PoolManager(
+    maxsize=20,
+    retries=urllib3.Retry(3, backoff_factor=0.2),
+)
+
+
+class HTTPStatusError(Exception):
+    """Raised when an HTTP response has a 4xx/5xx status."""
+
+    def __init__(self, status: int, body: str):
+        super().__init__(f"HTTP {status}: {body}")
+        self.status = status
+        self.body = body
+
+
+def basic_auth_headers(username: str, password: str) -> Dict[str, str]:
+    """Build an HTTP Basic Authorization header."""
+    return urllib3.make_headers(basic_auth=f"{username}:{password}")
+
+
+def raise_for_status(response) -> None:
+    """Raise HTTPStatusError for error responses (mirrors requests' helper)."""
+    if response.status >= 400:
+        raise HTTPStatusError(response.status, response.data.decode("utf-8", "replace"))
+
+
+def response_json(response) -> Any:
+    """Decode a JSON response body."""
+    return json.loads(response.data)
+
+
+def post_form(
+    url: str, fields: Dict[str, str], headers: Optional[Dict[str, str]] = None
+):
+    """POST application/x-www-form-urlencoded fields."""
+    return HTTP.request(
+        "POST", url, fields=fields, headers=headers, encode_multipart=False
+    )
+
+
+def post_json(url: str, payload: Any, headers: Optional[Dict[str, str]] = None):
+    """POST a JSON payload."""
+    return HTTP.request(
+        "POST",
+        url,
+        body=json.dumps(payload),
+        headers={**(headers or {}), "Content-Type": "application/json"},
+    )
@@ -2,11 +2,21 @@
 
 import os
 import json
+import base64
 import hashlib
 import hmac
+import traceback
 from typing import Dict, Any, Optional
-import boto3
-from botocore.exceptions import ClientError
+from urllib.parse import parse_qsl
+
+from .http_pool import (
+    basic_auth_headers,
+    post_form,
+    post_json,
+    raise_for_status,
+    response_json,
+)
+from .twilio_credentials import get_twilio_credentials
 
 
 class TwilioClient:
@@ -14,43 +24,11 @@ class TwilioClient:
 
     def __init__(self):
         """Initialize Twilio client with credentials from Parameter Store."""
-        self.ssm_client = boto3.client("ssm")
         self.region = os.environ.get("AWS_REGION", "eu-west-1")
-        self._credentials = None
 
     def _get_credentials(self) -> Dict[str, str]:
         """Retrieve Twilio credentials from AWS Systems Manager Parameter Store."""
-        if self._credentials:
-            return self._credentials
-
-        parameter_path = os.environ.get("TWILIO_PARAMETER_PATH", "/mabani/twilio")
-
-        try:
-            # Get all parameters under the path
-            response = self.ssm_client.get_parameters_by_path(
-                Path=parameter_path,
-                Recursive=True,
-                WithDecryption=True,  # Decrypt SecureString parameters
-            )
-
-            parameters = response.get("Parameters", [])
-
-            if not parameters:
-                raise ValueError(f"No parameters found at path: {parameter_path}")
-
-            # Convert parameters to dictionary
-            credentials = {}
-            for param in parameters:
-                # Extract the key name from the full path (e.g., /mabani/twilio/auth_token -> auth_token)
-                key = param["Name"].split("/")[-1]
-                credentials[key] = param["Value"]
-
-            self._credentials = credentials
-            return self._credentials
-
-        except ClientError as error:
-            print(f"Error retrieving Twilio credentials from Parameter Store: {error}")
-            raise
+        return get_twilio_credentials()
 
     def validate_signature(
         self, signature: str, url: str, params: Dict[str, Any]
@@ -75,8 +53,9 @@ class TwilioClient:
                 return False
 
             # Sort parameters and concatenate with URL
-            sorted_params = sorted(params.items())
-            data = url + "".join([f"{k}{v}" for k, v in sorted_params])
+            data_parts = [url]
+            data_parts.extend(k + str(v) for k, v in sorted(params.items()))
+            data = "".join(data_parts)
 
             # Compute HMAC-SHA1
             computed_signature = hmac.new(
@@ -84,8 +63,6 @@ class TwilioClient:
             ).digest()
 
             # Base64 encode
-            import base64
-
             computed_signature_b64 = base64.b64encode(computed_signature).decode()
             
             is_valid = hmac.compare_digest(computed_signature_b64, signature)
@@ -123,9 +100,6 @@ class TwilioClient:
                 raise ValueError("Missing required Twilio credentials")
 
             # Use Twilio REST API
-            import requests
-            from requests.auth import HTTPBasicAuth
-
             url = f"https://api.twilio.com/2010-04-01/Accounts/{account_sid}/Messages.json"
 
             data = {"From": from_number, "To": to_number, "Body": message}
@@ -133,12 +107,12 @@ class TwilioClient:
             if media_url:
                 data["MediaUrl"] = media_url
 
-            response = requests.post(
-                url, data=data, auth=HTTPBasicAuth(account_sid, auth_token)
+            response = post_form(
+                url, data, headers=basic_auth_headers(account_sid, auth_token)
             )
 
-            response.raise_for_status()
-            return response.json()
+            raise_for_status(response)
+            return response_json(response)
 
         except Exception as error:
             print(f"Error sending Twilio message: {error}")
@@ -222,9 +196,6 @@ class TwilioClient:
                 return self.send_message(to_number, body_text)
 
             # 2. Create Content Resource (Dynamic) via Direct HTTP
-            import requests
-            from requests.auth import HTTPBasicAuth
-            
             # URL for creating content
             # API: https://content.twilio.com/v1/Content
             content_url = "https://content.twilio.com/v1/Content"
@@ -239,18 +210,15 @@ class TwilioClient:
             }
             
             # Create content
-            content_resp = requests.post(
-                content_url,
-                json=payload,
-                auth=HTTPBasicAuth(account_sid, auth_token),
-                headers={"Content-Type": "application/json"}
-            )
+            auth_headers = basic_auth_headers(account_sid, auth_token)
+            content_resp = post_json(content_url, payload, headers=auth_headers)
             
-            if content_resp.status_code not in [200, 201]:
-                print(f"Failed to create content: {content_resp.status_code} - {content_resp.text}")
-                raise Exception(f"Content API Error: {content_resp.text}")
+            if content_resp.status not in [200, 201]:
+                content_text = content_resp.data.decode("utf-8", "replace")
+                print(f"Failed to create content: {content_resp.status} - {content_text}")
+                raise Exception(f"Content API Error: {content_text}")
                 
-            content_data = content_resp.json()
+            content_data = response_json(content_resp)
             content_sid = content_data["sid"]
             print(f"Created ephemeral content {content_sid} for {to_number}")
             
@@ -264,23 +232,19 @@ class TwilioClient:
                 "ContentSid": content_sid
             }
             
-            msg_resp = requests.post(
-                msg_url,
-                data=msg_data,
-                auth=HTTPBasicAuth(account_sid, auth_token)
-            )
+            msg_resp = post_form(msg_url, msg_data, headers=auth_headers)
             
-            if msg_resp.status_code not in [200, 201]:
-                 print(f"Failed to send message linked to content: {msg_resp.status_code} - {msg_resp.text}")
-                 raise Exception(f"Message Send Error: {msg_resp.text}")
+            if msg_resp.status not in [200, 201]:
+                 msg_text = msg_resp.data.decode("utf-8", "replace")
+                 print(f"Failed to send message linked to content: {msg_resp.status} - {msg_text}")
+                 raise Exception(f"Message Send Error: {msg_text}")
                  
-            msg_json = msg_resp.json()
+            msg_json = response_json(msg_resp)
             print(f"Interactive message sent: {msg_json['sid']}")
             return msg_json
             
         except Exception as error:
             print(f"Error sending interactive message: {error}")
-            import traceback
             traceback.print_exc()
             # Fallback to plain text with instructions
             fallback_text = f"{body_text}\n\n[Display Error: Please reply with your choice]"
@@ -297,14 +261,26 @@ class TwilioClient:
         Returns:
             Parsed parameters as dictionary
         """
-        from urllib.parse import parse_qs
-
         if not body:
             return {}
 
-        parsed = parse_qs(body)
-        # Convert single-item lists to values
-        return {k: v[0] if len(v) == 1 else v for k, v in parsed.items()}
+        pairs = parse_qsl(body, keep_blank_values=True)
+        parsed = dict(pairs)
+        if len(parsed) == len(pairs):
+            return parsed
+
+        # Repeated keys: keep every value, as a list, like parse_qs would
+        grouped: Dict[str, Any] = {}
+        for k, v in pairs:
+            if k in grouped:
+                existing = grouped[k]
+                if isinstance(existing, list):
+                    existing.append(v)
+                else:
+                    grouped[k] = [existing, v]
+            else:
+                grouped[k] = v
+        return grouped
 
     def process_interactive_response(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
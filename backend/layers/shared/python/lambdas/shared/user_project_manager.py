@@ -4,10 +4,11 @@ Manages persistent user preferences (last selected project) in DynamoDB.
 """
 
 import os
-import boto3
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 from botocore.exceptions import ClientError
 
+from .aws_clients import get_dax_resource, get_table
+
 class UserProjectManager:
     """Manages user project preferences in DynamoDB."""
 
@@ -16,16 +17,22 @@ class UserProjectManager:
         if not self.table_name:
             self.table_name = "taskflow-backend-dev-user-projects"
             
-        self.dynamodb = boto3.resource("dynamodb")
-        self.table = self.dynamodb.Table(self.table_name)
+        # Point reads here tolerate DAX's eventually consistent item cache
+        self.dynamodb = get_dax_resource()
+        self.table = get_table(self.table_name, use_dax=True)
 
-    def get_last_project(self, phone_number: str) -> Optional[str]:
+    def get_last_project(
+        self, phone_number: str, consistent_read: bool = False
+    ) -> Optional[str]:
         """
         Get the last selected project ID for a user.
+        Pass consistent_read=True to read straight after a write (bypasses DAX).
         """
         try:
             # Table uses 'phoneNumber' as PK
-            response = self.table.get_item(Key={"phoneNumber": phone_number})
+            response = self.table.get_item(
+                Key={"phoneNumber": phone_number}, ConsistentRead=consistent_read
+            )
             item = response.get("Item")
             return item.get("lastProjectId") if item else None
         except ClientError as e:
@@ -37,12 +44,28 @@ class UserProjectManager:
         Save the selected project ID for a user.
         """
         try:
-            self.table.put_item(
-                Item={
-                    "phoneNumber": phone_number,
-                    "lastProjectId": project_id
-                }
+            self.table.update_item(
+                Key={"phoneNumber": phone_number},
+                UpdateExpression="SET lastProjectId = :p",
+                ExpressionAttributeValues={":p": project_id},
             )
         except ClientError as e:
             print(f"Error saving user project: {e}")
             raise
+
+    def set_last_projects(self, pairs: Iterable[Tuple[str, str]]) -> None:
+        """
+        Save the selected project for several users in batched writes.
+        """
+        try:
+            with self.table.batch_writer(overwrite_by_pkeys=["phoneNumber"]) as batch:
+                for phone_number, project_id in pairs:
+                    batch.put_item(
+                        Item={
+                            "phoneNumber": phone_number,
+                            "lastProjectId": project_id
+                        }
+                    )
+        except ClientError as e:
+            print(f"Error saving user projects: {e}")
+            raise
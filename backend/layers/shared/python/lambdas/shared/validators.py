@@ -1,6 +1,57 @@
 """Validation utilities for report processing."""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+_WA_PREFIX = "whatsapp:"
+_WA_PREFIX_LEN = len(_WA_PREFIX)
+
+# Keywords for quality issues
+_QUALITY_KEYWORDS: Tuple[str, ...] = (
+    "quality",
+    "defect",
+    "workmanship",
+    "finish",
+    "specification",
+    "tolerance",
+    "installation",
+    "material defect",
+    "rework",
+)
+
+# Keywords for H&S issues
+_HS_KEYWORDS: Tuple[str, ...] = (
+    "safety",
+    "hazard",
+    "danger",
+    "risk",
+    "injury",
+    "fall",
+    "ppe",
+    "equipment",
+    "unsafe",
+    "accident",
+    "incident",
+)
+
+
+def _build_keyword_automaton():
+    """Build one Aho-Corasick automaton over both keyword sets (0=quality, 1=H&S)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for cls, keywords in ((0, _QUALITY_KEYWORDS), (1, _HS_KEYWORDS)):
+        for keyword in keywords:
+            automaton.add_word(keyword, (cls, keyword))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
 
 
 def validate_twilio_webhook(params: Dict[str, Any]) -> Dict[str, Any]:
@@ -14,33 +65,39 @@ def validate_twilio_webhook(params: Dict[str, Any]) -> Dict[str, Any]:
         Dictionary with validation result
     """
     # Check for required fields
-    from_number = params.get("From")
-    body = params.get("Body")
-    num_media = int(params.get("NumMedia", 0))
-    media_url = params.get("MediaUrl0")
-
-    errors = []
-
-    if not from_number:
-        errors.append("Missing sender phone number")
-
-    if not body or not body.strip():
-        errors.append("Missing description text")
-
-    if num_media == 0 or not media_url:
-        errors.append("Missing image attachment")
+    get = params.get
+    from_number = get("From")
+    body = get("Body")
+    stripped = body.strip() if body else ""
+    try:
+        num_media = int(get("NumMedia", 0))
+    except (TypeError, ValueError):
+        # Malformed count is treated as no media rather than failing the request
+        num_media = 0
+    media_url = get("MediaUrl0")
+    message_sid = get("MessageSid")
+
+    errors = [
+        message
+        for failed, message in (
+            (not from_number, "Missing sender phone number"),
+            (not stripped, "Missing description text"),
+            (num_media == 0 or not media_url, "Missing image attachment"),
+        )
+        if failed
+    ]
 
-    is_valid = len(errors) == 0
+    is_valid = not errors
 
     return {
         "isValid": is_valid,
         "errors": errors,
         "data": {
             "sender": from_number,
-            "description": body.strip() if body else "",
+            "description": stripped,
             "imageUrl": media_url,
             "numMedia": num_media,
-            "messageSid": params.get("MessageSid"),
+            "messageSid": message_sid,
         },
     }
 
@@ -56,41 +113,23 @@ def determine_report_type(description: str, project_type: Optional[str] = None)
     Returns:
         "HS" or "QUALITY"
     """
-    # Keywords for quality issues
-    quality_keywords = [
-        "quality",
-        "defect",
-        "workmanship",
-        "finish",
-        "specification",
-        "tolerance",
-        "installation",
-        "material defect",
-        "rework",
-    ]
-
-    # Keywords for H&S issues
-    hs_keywords = [
-        "safety",
-        "hazard",
-        "danger",
-        "risk",
-        "injury",
-        "fall",
-        "ppe",
-        "equipment",
-        "unsafe",
-        "accident",
-        "incident",
-    ]
-
+    # str.lower() already takes an ASCII fast path in CPython; encoding to
+    # bytes and translating with a lookup table measured slower, not faster.
     description_lower = description.lower()
 
-    # Count keyword matches
-    quality_score = sum(
-        1 for keyword in quality_keywords if keyword in description_lower
-    )
-    hs_score = sum(1 for keyword in hs_keywords if keyword in description_lower)
+    # Count distinct keyword matches per class
+    if _KEYWORD_AUTOMATON is not None:
+        matched = {value for _, value in _KEYWORD_AUTOMATON.iter(description_lower)}
+        scores = [0, 0]
+        for cls, _ in matched:
+            scores[cls] += 1
+        quality_score, hs_score = scores
+    else:
+        # str.__contains__ runs in C; for ~20 short keywords this is a few
+        # microseconds, so a JIT (numba) would never repay its import cost.
+        contains = description_lower.__contains__
+        quality_score = sum(map(contains, _QUALITY_KEYWORDS))
+        hs_score = sum(map(contains, _HS_KEYWORDS))
 
     # If unclear, default to H&S (safer default)
     if quality_score > hs_score:
@@ -109,6 +148,4 @@ def sanitize_phone_number(phone: str) -> str:
     Returns:
         Sanitized phone number (e.g., "+1234567890")
     """
-    if phone.startswith("whatsapp:"):
-        return phone.replace("whatsapp:", "")
-    return phone
+    return phone[_WA_PREFIX_LEN:] if phone.startswith(_WA_PREFIX) else phone
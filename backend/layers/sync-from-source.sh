@@ -16,10 +16,13 @@ if [ ! -f "$SCRIPT_DIR/shared/python/lambdas/__init__.py" ]; then
 # This allows lambdas package to span across function package and layers
 __path__ = __import__("pkgutil").extend_path(__path__, __name__)' > "$SCRIPT_DIR/shared/python/lambdas/__init__.py"
 fi
+cp "$BACKEND_DIR/lambdas/shared/aws_clients.py" "$SCRIPT_DIR/shared/python/lambdas/shared/"
 cp "$BACKEND_DIR/lambdas/shared/lambda_helpers.py" "$SCRIPT_DIR/shared/python/lambdas/shared/"
 cp "$BACKEND_DIR/lambdas/shared/bedrock_client.py" "$SCRIPT_DIR/shared/python/lambdas/shared/"
+cp "$BACKEND_DIR/lambdas/shared/http_pool.py" "$SCRIPT_DIR/shared/python/lambdas/shared/"
 cp "$BACKEND_DIR/lambdas/shared/s3_client.py" "$SCRIPT_DIR/shared/python/lambdas/shared/"
 cp "$BACKEND_DIR/lambdas/shared/twilio_client.py" "$SCRIPT_DIR/shared/python/lambdas/shared/"
+cp "$BACKEND_DIR/lambdas/shared/twilio_credentials.py" "$SCRIPT_DIR/shared/python/lambdas/shared/"
 cp "$BACKEND_DIR/lambdas/shared/conversation_state.py" "$SCRIPT_DIR/shared/python/lambdas/shared/"
 cp "$BACKEND_DIR/lambdas/shared/validators.py" "$SCRIPT_DIR/shared/python/lambdas/shared/"
 cp "$BACKEND_DIR/lambdas/shared/config_manager.py" "$SCRIPT_DIR/shared/python/lambdas/shared/"
@@ -36,6 +39,7 @@ if [ ! -f "$SCRIPT_DIR/kb/python/lambdas/__init__.py" ]; then
 # This allows lambdas package to span across function package and layers
 __path__ = __import__("pkgutil").extend_path(__path__, __name__)' > "$SCRIPT_DIR/kb/python/lambdas/__init__.py"
 fi
+cp "$BACKEND_DIR/lambdas/shared/aws_clients.py" "$SCRIPT_DIR/kb/python/lambdas/shared/"
 cp "$BACKEND_DIR/lambdas/shared/lambda_helpers.py" "$SCRIPT_DIR/kb/python/lambdas/shared/"
 cp "$BACKEND_DIR/lambdas/shared/kb_repositories.py" "$SCRIPT_DIR/kb/python/lambdas/shared/"
 cp "$BACKEND_DIR/lambdas/shared/faiss_utils.py" "$SCRIPT_DIR/kb/python/lambdas/shared/"
@@ -3,13 +3,9 @@ Script to populate DynamoDB with default configuration values.
 Run this once to initialize the CONFIG entries in the database.
 """
 
-import boto3
 import os
 
-# Initialize DynamoDB
-dynamodb = boto3.resource('dynamodb', region_name='eu-west-1')
 table_name = 'taskflow-backend-dev-reports'
-table = dynamodb.Table(table_name)
 
 # Import defaults from config_manager
 import sys
@@ -18,9 +14,13 @@ from shared.config_manager import ConfigManager
 
 def populate_defaults():
     """Populate the database with default configuration values."""
-    config_manager = ConfigManager(table_name=table_name)
+    # Imported here so merely importing this module doesn't load botocore
+    import boto3
+
+    dynamodb = boto3.resource('dynamodb', region_name='eu-west-1')
+    table = dynamodb.Table(table_name)
     
-    # Configuration types to populate
+    # Configuration types to populate (already canonical upper-case SK values)
     config_types = [
         "PROJECTS",
         "HAZARD_TAXONOMY",
@@ -31,29 +31,32 @@ def populate_defaults():
         "RESPONSIBLE_PERSONS"
     ]
     
-    for config_type in config_types:
-        print(f"Populating {config_type}...")
-        
-        # Get the defaults
-        defaults = config_manager._get_defaults(config_type)
-        
-        if not defaults:
-            print(f"  ⚠️  No defaults found for {config_type}")
-            continue
-        
-        # Write to DynamoDB
-        try:
-            table.put_item(
-                Item={
-                    "PK": "CONFIG",
-                    "SK": config_type.upper(),
-                    "values": defaults
-                }
-            )
-            print(f"  ✅ Successfully populated {config_type} ({len(defaults)} items)")
-        except Exception as e:
-            print(f"  ❌ Error populating {config_type}: {e}")
-    
+    # batch_writer packs the puts into BatchWriteItem calls and retries
+    # any unprocessed items
+    try:
+        with table.batch_writer() as batch:
+            for config_type in config_types:
+                print(f"Populating {config_type}...")
+
+                # Get the defaults
+                defaults = ConfigManager._get_defaults(config_type)
+
+                if not defaults:
+                    print(f"  ⚠️  No defaults found for {config_type}")
+                    continue
+
+                batch.put_item(
+                    Item={
+                        "PK": "CONFIG",
+                        "SK": config_type,
+                        "values": defaults
+                    }
+                )
+                print(f"  ✅ Queued {config_type} ({len(defaults)} items)")
+    except Exception as e:
+        print(f"  ❌ Error populating config defaults: {e}")
+        return
+
     print("\n✨ Database population complete!")
 
 if __name__ == "__main__":
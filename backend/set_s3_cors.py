@@ -1,8 +1,8 @@
 
-import boto3
-from botocore.exceptions import ClientError
-
 def set_cors():
+    import boto3
+    from botocore.exceptions import ClientError
+
     s3 = boto3.client('s3')
     bucket_name = 'taskflow-backend-dev-reports'
 
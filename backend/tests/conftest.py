@@ -1,31 +1,51 @@
 """Pytest configuration and shared fixtures for all tests."""
 
+import importlib
+import sys
 import pytest
-from unittest.mock import MagicMock
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import MagicMock, patch
 import json
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_lambda_context():
-    """Create a mock Lambda context object."""
-    context = MagicMock()
-    context.function_name = "test-function"
-    context.function_version = "$LATEST"
-    context.invoked_function_arn = (
-        "arn:aws:lambda:eu-west-1:123456789012:function:test-function"
+    """Create a Lambda context object (attribute reads only, so no MagicMock)."""
+    return SimpleNamespace(
+        function_name="test-function",
+        function_version="$LATEST",
+        invoked_function_arn=(
+            "arn:aws:lambda:eu-west-1:123456789012:function:test-function"
+        ),
+        memory_limit_in_mb=256,
+        aws_request_id="test-request-id",
+        log_group_name="/aws/lambda/test-function",
+        log_stream_name="2024/01/01/[$LATEST]test-stream",
+        get_remaining_time_in_millis=lambda: 30000,
     )
-    context.memory_limit_in_mb = 256
-    context.aws_request_id = "test-request-id"
-    context.log_group_name = "/aws/lambda/test-function"
-    context.log_stream_name = "2024/01/01/[$LATEST]test-stream"
-    context.get_remaining_time_in_millis = MagicMock(return_value=30000)
-    return context
 
 
-@pytest.fixture
+def _freeze(value):
+    """Recursively wrap dicts in read-only MappingProxyType views."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def _thaw(value):
+    """Recursively copy read-only mappings back into plain dicts."""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    return value
+
+
+@pytest.fixture(scope="session")
 def api_gateway_event():
-    """Create a basic API Gateway event."""
-    return {
+    """
+    Create a basic API Gateway event (read-only, built once per session).
+    Use mutable_api_gateway_event for tests that modify or pass it to handlers.
+    """
+    event = {
         "httpMethod": "GET",
         "path": "/test",
         "pathParameters": None,
@@ -50,22 +70,35 @@ def api_gateway_event():
             "authorizer": None,
         },
     }
+    return _freeze(event)
+
+
+@pytest.fixture
+def mutable_api_gateway_event(api_gateway_event):
+    """Create a private, mutable copy of the base API Gateway event."""
+    return _thaw(api_gateway_event)
 
 
 @pytest.fixture
 def authenticated_event(api_gateway_event):
     """Create an authenticated API Gateway event with Cognito claims."""
-    event = api_gateway_event.copy()
-    event["requestContext"]["authorizer"] = {
-        "claims": {
-            "sub": "test-user-id",
-            "email": "test@example.com",
-            "cognito:username": "test-user-id",
-            "given_name": "Test",
-            "family_name": "User",
-        }
+    # Fresh nested dicts per test, so the session event is never shared
+    event = _thaw(api_gateway_event)
+    return {
+        **event,
+        "requestContext": {
+            **event["requestContext"],
+            "authorizer": {
+                "claims": {
+                    "sub": "test-user-id",
+                    "email": "test@example.com",
+                    "cognito:username": "test-user-id",
+                    "given_name": "Test",
+                    "family_name": "User",
+                }
+            },
+        },
     }
-    return event
 
 
 @pytest.fixture
@@ -99,6 +132,30 @@ def mock_dynamodb_table():
     return table
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _patched_table(request):
+    """
+    Patch a handler module's DynamoDB table once per test module.
+    Opt in by setting ``TABLE_PATCH_TARGET`` (e.g. "lambdas.items.table")
+    in the test module; other modules get None.
+    """
+    target = getattr(request.module, "TABLE_PATCH_TARGET", None)
+    if target is None:
+        yield None
+        return
+    with patch(target) as table:
+        yield table
+
+
+@pytest.fixture
+def mock_table(_patched_table):
+    """Return the module's patched table with calls and configuration cleared."""
+    if _patched_table is None:
+        pytest.fail("mock_table requires TABLE_PATCH_TARGET in the test module")
+    _patched_table.reset_mock(return_value=True, side_effect=True)
+    return _patched_table
+
+
 @pytest.fixture
 def mock_s3_client():
     """Create a mock S3 client."""
@@ -128,6 +185,24 @@ def mock_aws_services(monkeypatch):
     monkeypatch.setattr("boto3.client", mock_boto3)
     monkeypatch.setattr("boto3.resource", mock_boto3)
 
+    # Drop process-wide clients so each test builds them from the mock
+    from lambdas.shared import aws_clients
+
+    monkeypatch.setattr(aws_clients, "_dynamodb", None)
+    monkeypatch.setattr(aws_clients, "_dax", None)
+    monkeypatch.setattr(aws_clients, "_dynamodb_client", None)
+    monkeypatch.setattr(aws_clients, "_ssm_client", None)
+    monkeypatch.setattr(aws_clients, "_s3_client", None)
+    monkeypatch.setattr(aws_clients, "_tables", {})
+
+    from lambdas.shared import config_manager
+
+    monkeypatch.setattr(config_manager, "_CONFIG_CACHE", {})
+
+    from lambdas.shared import twilio_credentials
+
+    monkeypatch.setattr(twilio_credentials, "_CACHE", {"creds": None, "ts": 0.0})
+
     # Mock environment variables
     monkeypatch.setenv("AWS_REGION", "eu-west-1")
     monkeypatch.setenv("DYNAMODB_TABLE_NAME", "test-table")
@@ -142,6 +217,38 @@ def mock_aws_services(monkeypatch):
     return mock_boto3
 
 
+_FLOW_HANDLER_MODULES = (
+    "start_handler",
+    "project_handler",
+    "confirmation_handler",
+    "data_collection_handlers",
+    "finalization_handler",
+)
+
+
+@pytest.fixture(scope="module")
+def flow_handlers():
+    """
+    Import the WhatsApp flow handlers against the in-memory shared stubs.
+    Module-scoped: the stubs and the re-imported handler modules are rolled
+    back once the requesting module finishes, so later modules that patch
+    ``lambdas.handlers.*`` by name still see the real modules.
+    """
+    from tests.helpers.mock_shared import install_shared_stubs
+
+    import lambdas.handlers as handlers_pkg
+
+    with pytest.MonkeyPatch.context() as mp:
+        install_shared_stubs(mp)
+        modules = {}
+        for name in _FLOW_HANDLER_MODULES:
+            qualified = f"lambdas.handlers.{name}"
+            mp.delitem(sys.modules, qualified, raising=False)
+            mp.setattr(handlers_pkg, name, getattr(handlers_pkg, name, None), raising=False)
+            modules[name] = importlib.import_module(qualified)
+        yield SimpleNamespace(**modules)
+
+
 @pytest.fixture
 def sample_user_data():
     """Sample user data for testing."""
@@ -14,6 +14,8 @@ from tests.helpers.serverless_test_helpers import (
 @pytest.fixture(scope="module")
 def deployed_api_client():
     """Create API test client for deployed AWS API."""
+    # Under pytest-xdist each worker is its own process, so this fixture and
+    # the pooled session behind it are built per worker, never pickled across.
     base_url = os.getenv(
         "DEPLOYED_API_BASE_URL",
         "https://z83ea8fx85.execute-api.eu-west-1.amazonaws.com/dev",
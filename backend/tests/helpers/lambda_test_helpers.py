@@ -1,8 +1,31 @@
 """Helper utilities for testing Lambda functions."""
 
 import json
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+except ImportError:  # Optional speed-up; fall back to stdlib json
+    orjson = None
+
+
+_DEFAULT_HEADERS = MappingProxyType({
+    "Content-Type": "application/json",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "Content-Type,Authorization",
+    "Access-Control-Allow-Methods": "GET,POST,PUT,DELETE,OPTIONS",
+})
+
+if orjson is not None:
+    def _dumps(body: Any) -> str:
+        return orjson.dumps(body, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _loads = orjson.loads
+else:
+    _dumps = json.JSONEncoder(separators=(",", ":")).encode
+    _loads = json.loads
+
 
 def create_api_response(
     status_code: int,
@@ -10,20 +33,10 @@ def create_api_response(
     headers: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:
     """Create a standardized API Gateway response."""
-    default_headers = {
-        "Content-Type": "application/json",
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Headers": "Content-Type,Authorization",
-        "Access-Control-Allow-Methods": "GET,POST,PUT,DELETE,OPTIONS",
-    }
-
-    if headers:
-        default_headers.update(headers)
-
     return {
         "statusCode": status_code,
-        "headers": default_headers,
-        "body": json.dumps(body) if not isinstance(body, str) else body,
+        "headers": {**_DEFAULT_HEADERS, **headers} if headers else dict(_DEFAULT_HEADERS),
+        "body": _dumps(body) if not isinstance(body, str) else body,
     }
 
 
@@ -33,10 +46,10 @@ def parse_event_body(event: Dict[str, Any]) -> Dict[str, Any]:
         return {}
 
     body = event["body"]
-    if isinstance(body, str):
+    if isinstance(body, (str, bytes, bytearray)):
         try:
-            return json.loads(body)
-        except json.JSONDecodeError:
+            return _loads(body)
+        except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
             return {}
     return body
 
@@ -62,6 +75,11 @@ def create_error_response(
     return create_api_response(status_code, body)
 
 
+def event_with(base: Dict[str, Any], **overrides: Any) -> Dict[str, Any]:
+    """Return a shallow copy of an API Gateway event with top-level overrides."""
+    return {**base, **overrides}
+
+
 def assert_api_response(response: Dict[str, Any], expected_status: int = 200):
     """Assert that a response has the expected structure and status code."""
     assert "statusCode" in response
@@ -70,8 +88,7 @@ def assert_api_response(response: Dict[str, Any], expected_status: int = 200):
     assert response["statusCode"] == expected_status
 
     # Parse body to ensure it's valid JSON
-    body = json.loads(response["body"])
-    return body
+    return _loads(response["body"])
 
 
 def assert_error_response(response: Dict[str, Any], expected_status: int = 400):
@@ -0,0 +1,104 @@
+"""In-memory stand-ins for the shared modules used by the WhatsApp flow handlers."""
+
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from unittest.mock import MagicMock
+
+
+class MockConfigManager:
+    def get_options(self, key):
+        if key == "PROJECTS":
+            return [
+                {"id": "PROJ-A", "name": "Project Alpha", "locations": ["Alpha Loc 1", "Alpha Loc 2"]},
+                {"id": "PROJ-B", "name": "Project Beta", "locations": ["Beta Loc 1"]}
+            ]
+        if key == "LOCATIONS":
+            return ["Global Loc 1", "Global Loc 2"]
+        if key == "HAZARD_TAXONOMY":
+            return ["A1 Hazard"]
+        return []
+
+
+class MockUserProjectManager:
+    def __init__(self, table=None): pass
+    def get_last_project(self, phone, consistent_read=False):
+        if phone == "CLIENT_RETURNING":
+            return "PROJ-A"
+        return None
+    def set_last_project(self, phone, pid): pass
+
+
+class MockBedrockClient:
+    def caption_image(self, **kwargs): return "A construction site"
+    def classify_observation_type(self, **kwargs): return "Unsafe Act"
+    def classify_hazard_type(self, **kwargs): return ["A1 Hazard"]
+
+
+class MockS3Client:
+    def upload_image(self, **kwargs):
+        return {
+            "s3Key": "key",
+            "s3Url": "s3://bucket/key",
+            "httpsUrl": "https://bucket/key"
+        }
+    def download_image(self, key): return b"bytes"
+
+
+@dataclass(frozen=True, slots=True)
+class ConversationSnapshot:
+    """One immutable conversation record; updates produce a new snapshot."""
+    state: Optional[str]
+    draft_data: Tuple[Tuple[str, Any], ...] = ()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Shape handlers expect from ConversationState.get_state."""
+        return {"state": self.state, "draftData": dict(self.draft_data)}
+
+
+class _ConversationStore(dict):
+    """Phone number -> snapshot; unknown numbers start from an empty one."""
+    def __missing__(self, phone_number):
+        snapshot = self[phone_number] = ConversationSnapshot(None)
+        return snapshot
+
+
+class MockState:
+    def __init__(self):
+        self.state: Dict[str, ConversationSnapshot] = _ConversationStore()
+    def start_conversation(self, phone_number, report_id, draft_data, start_state):
+        self.state[phone_number] = ConversationSnapshot(start_state, tuple(draft_data.items()))
+    def update_state(self, phone_number, new_state, curr_data=None):
+        draft = {**dict(self.state[phone_number].draft_data), **(curr_data or {})}
+        self.state[phone_number] = ConversationSnapshot(new_state, tuple(draft.items()))
+    def get_state(self, phone_number):
+        snapshot = self.state.get(phone_number)
+        return snapshot.as_dict() if snapshot is not None else None
+    def clear_state(self, phone_number):
+        self.state.pop(phone_number, None)
+
+
+# shared module name -> (attribute the handlers import, stand-in class)
+SHARED_STUBS: Dict[str, tuple] = {
+    "config_manager": ("ConfigManager", MockConfigManager),
+    "user_project_manager": ("UserProjectManager", MockUserProjectManager),
+    "bedrock_client": ("BedrockClient", MockBedrockClient),
+    "s3_client": ("S3Client", MockS3Client),
+    "conversation_state": ("ConversationState", MockState),
+}
+
+
+def install_shared_stubs(monkeypatch: Optional[Any] = None) -> None:
+    """
+    Register the stand-ins under both ``shared.X`` and ``lambdas.shared.X``.
+    With a MonkeyPatch the entries are undone on teardown; without one they
+    are written straight into sys.modules (standalone scripts).
+    """
+    setitem = monkeypatch.setitem if monkeypatch is not None else (
+        lambda mapping, key, value: mapping.__setitem__(key, value)
+    )
+    for module_name, (attr, cls) in SHARED_STUBS.items():
+        module = MagicMock()
+        setattr(module, attr, cls)
+        setitem(sys.modules, f"shared.{module_name}", module)
+        setitem(sys.modules, f"lambdas.shared.{module_name}", module)
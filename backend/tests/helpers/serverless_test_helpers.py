@@ -2,24 +2,103 @@
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Optional
-from urllib.parse import urljoin
+
+try:
+    import httpx
+except ImportError:  # Only needed for async_mode
+    httpx = None
+
+
+def _create_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared across clients so keep-alive connections survive between test modules.
+# Never set per-client state (e.g. auth headers) on it; pass headers per request.
+_SHARED_SESSION = _create_session()
 
 
 class ServerlessTestClient:
     """Client for testing serverless functions locally or remotely."""
 
-    def __init__(self, base_url: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        shared_session: bool = True,
+        async_mode: bool = False,
+    ):
         """
         Initialize test client.
 
         Args:
             base_url: Base URL for API (defaults to local serverless-offline)
+            shared_session: Reuse the module-wide session (False for a private one)
+            async_mode: Also create an httpx.AsyncClient (HTTP/2 when h2 is
+                installed) for the aget/apost helpers
         """
-        self.base_url = base_url or os.getenv(
-            "TEST_API_BASE_URL", "http://localhost:3001"
+        # Stored with one trailing slash so request URLs are a plain concatenation
+        self.base_url = (
+            base_url or os.getenv("TEST_API_BASE_URL", "http://localhost:3001")
+        ).rstrip("/") + "/"
+        self.session = _SHARED_SESSION if shared_session else _create_session()
+        self.async_session = self._create_async_session() if async_mode else None
+
+    def _create_async_session(self):
+        """Create the httpx.AsyncClient used by the async helpers."""
+        if httpx is None:
+            raise RuntimeError("async_mode requires httpx (pip install 'httpx[http2]')")
+        try:
+            return httpx.AsyncClient(http2=True, base_url=self.base_url)
+        except ImportError:
+            # h2 not installed; multiplexing unavailable but requests still overlap
+            return httpx.AsyncClient(base_url=self.base_url)
+
+    async def _make_async_request(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ):
+        """Make HTTP request through the async client."""
+        if self.async_session is None:
+            raise RuntimeError("Client was created without async_mode=True")
+
+        request_headers = {
+            "Content-Type": "application/json",
+        }
+        if headers:
+            request_headers.update(headers)
+
+        return await self.async_session.request(
+            method, path.lstrip("/"), headers=request_headers, json=json_data
         )
-        self.session = requests.Session()
+
+    async def aget(self, path: str, headers: Optional[Dict[str, str]] = None):
+        """Make async GET request."""
+        return await self._make_async_request("GET", path, headers=headers)
+
+    async def apost(
+        self,
+        path: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """Make async POST request."""
+        return await self._make_async_request(
+            "POST", path, headers=headers, json_data=json_data
+        )
+
+    async def aclose(self) -> None:
+        """Close the async client, if one was created."""
+        if self.async_session is not None:
+            await self.async_session.aclose()
 
     def _make_request(
         self,
@@ -30,7 +109,8 @@ class ServerlessTestClient:
         json_data: Optional[Dict[str, Any]] = None,
     ) -> requests.Response:
         """Make HTTP request to serverless API."""
-        url = urljoin(self.base_url, path.lstrip("/"))
+        assert "://" not in path, "path must be relative to base_url"
+        url = self.base_url + path.lstrip("/")
 
         request_headers = {
             "Content-Type": "application/json",
@@ -87,31 +167,24 @@ class ServerlessTestClient:
 
     def with_auth(self, token: str) -> "AuthenticatedClient":
         """Create authenticated client."""
-        return AuthenticatedClient(self.base_url, token)
+        return AuthenticatedClient(
+            self.base_url, token, async_mode=self.async_session is not None
+        )
 
 
 class AuthenticatedClient(ServerlessTestClient):
     """Authenticated test client."""
 
-    def __init__(self, base_url: str, token: str):
+    def __init__(self, base_url: str, token: str, async_mode: bool = False):
         """Initialize authenticated client."""
-        super().__init__(base_url)
+        # Private session: the token lives in its default headers, which must
+        # not leak onto the session shared by unauthenticated clients
+        super().__init__(base_url, shared_session=False, async_mode=async_mode)
         self.token = token
-        self.session.headers.update({"Authorization": f"Bearer {token}"})
-
-    def _make_request(
-        self,
-        method: str,
-        path: str,
-        headers: Optional[Dict[str, str]] = None,
-        data: Optional[Any] = None,
-        json_data: Optional[Dict[str, Any]] = None,
-    ) -> requests.Response:
-        """Make authenticated request."""
-        if headers is None:
-            headers = {}
-        headers.setdefault("Authorization", f"Bearer {self.token}")
-        return super()._make_request(method, path, headers, data, json_data)
+        auth_header = {"Authorization": f"Bearer {token}"}
+        self.session.headers.update(auth_header)
+        if self.async_session is not None:
+            self.async_session.headers.update(auth_header)
 
 
 def create_test_token(user_id: str = "test-user-id") -> str:
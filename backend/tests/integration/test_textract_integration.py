@@ -1,13 +1,7 @@
-import sys
 import os
 import boto3
 import pytest
 
-# Add backend to path so we can import modules
-backend_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
-if backend_path not in sys.path:
-    sys.path.append(backend_path)
-
 from lambdas.shared.document_processing import DocumentProcessingService
 
 @pytest.mark.skip(reason="Requires real AWS credentials and S3 upload")
@@ -0,0 +1,40 @@
+"""Unit tests for the shared AWS client factory."""
+
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from lambdas.shared import aws_clients
+from lambdas.shared.config_manager import ConfigManager
+from lambdas.shared.conversation_state import ConversationState
+from lambdas.shared.user_project_manager import UserProjectManager
+
+
+@pytest.fixture
+def dax(monkeypatch):
+    """Point DAX_ENDPOINT at a fake amazondax module and return its resource."""
+    amazondax = MagicMock()
+    monkeypatch.setitem(sys.modules, "amazondax", amazondax)
+    monkeypatch.setenv("DAX_ENDPOINT", "daxs://cluster.example")
+    return amazondax.AmazonDaxClient.resource.return_value
+
+
+@pytest.mark.unit
+def test_only_opted_in_managers_read_through_dax(dax):
+    """Config and last-project reads use DAX; conversation state stays on DynamoDB."""
+    plain = aws_clients.get_dynamodb_resource()
+    assert plain is not dax
+
+    assert ConfigManager(table_name="reports").table is dax.Table.return_value
+    assert UserProjectManager(table_name="user-projects").table is dax.Table.return_value
+    assert ConversationState(table_name="conversations").table is plain.Table.return_value
+    assert aws_clients.get_table("items") is plain.Table.return_value
+
+
+@pytest.mark.unit
+def test_dax_falls_back_to_dynamodb_without_endpoint(monkeypatch):
+    """Without DAX_ENDPOINT the opt-in path is plain DynamoDB."""
+    monkeypatch.delenv("DAX_ENDPOINT", raising=False)
+
+    assert aws_clients.get_dax_resource() is aws_clients.get_dynamodb_resource()
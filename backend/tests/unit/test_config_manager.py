@@ -0,0 +1,154 @@
+"""Unit tests for the shared ConfigManager."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from lambdas.shared.config_manager import ConfigManager
+
+
+@pytest.mark.unit
+def test_get_options_served_from_cache():
+    """Repeated lookups within the TTL hit DynamoDB only once."""
+    manager = ConfigManager(table_name="test-reports")
+    manager.table.get_item.return_value = {"Item": {"values": ["Yard", "Roof"]}}
+
+    assert manager.get_options("locations") == ["Yard", "Roof"]
+    assert manager.get_options("LOCATIONS") == ["Yard", "Roof"]
+    manager.table.get_item.assert_called_once_with(
+        Key={"PK": "CONFIG", "SK": "LOCATIONS"}
+    )
+
+
+@pytest.mark.unit
+def test_invalidate_forces_refetch():
+    """Invalidating a config type re-reads it on the next lookup."""
+    manager = ConfigManager(table_name="test-reports")
+    manager.table.get_item.return_value = {"Item": {"values": ["Yard"]}}
+    manager.get_options("LOCATIONS")
+
+    manager.table.get_item.return_value = {"Item": {"values": ["Yard", "Roof"]}}
+    manager.invalidate("locations")
+
+    assert manager.get_options("LOCATIONS") == ["Yard", "Roof"]
+    assert manager.table.get_item.call_count == 2
+
+
+@pytest.mark.unit
+def test_missing_item_falls_back_to_defaults():
+    """A missing config row returns the built-in defaults."""
+    manager = ConfigManager(table_name="test-reports")
+    manager.table.get_item.return_value = {}
+
+    assert manager.get_options("SEVERITY_LEVELS") == ["High", "Medium", "Low"]
+
+
+@pytest.mark.unit
+def test_get_many_uses_single_batch_and_cache():
+    """get_many batches uncached types and fills missing rows with defaults."""
+    manager = ConfigManager(table_name="test-reports")
+    manager.table.get_item.return_value = {"Item": {"values": ["Yard"]}}
+    manager.get_options("LOCATIONS")
+    manager.dynamodb.batch_get_item.return_value = {
+        "Responses": {
+            "test-reports": [{"PK": "CONFIG", "SK": "BREACH_SOURCES", "values": ["X"]}]
+        },
+        "UnprocessedKeys": {},
+    }
+
+    result = manager.get_many(["LOCATIONS", "breach_sources", "SEVERITY_LEVELS"])
+
+    assert result == {
+        "LOCATIONS": ["Yard"],
+        "breach_sources": ["X"],
+        "SEVERITY_LEVELS": ["High", "Medium", "Low"],
+    }
+    manager.dynamodb.batch_get_item.assert_called_once_with(
+        RequestItems={
+            "test-reports": {
+                "Keys": [
+                    {"PK": "CONFIG", "SK": "BREACH_SOURCES"},
+                    {"PK": "CONFIG", "SK": "SEVERITY_LEVELS"},
+                ]
+            }
+        }
+    )
+
+
+@pytest.mark.unit
+def test_cached_options_are_not_shared_with_callers():
+    """Mutating a returned value must not change what later lookups see."""
+    manager = ConfigManager(table_name="test-reports")
+    manager.table.get_item.return_value = {
+        "Item": {"values": [{"id": "P1", "locations": ["Yard"]}]}
+    }
+
+    first = manager.get_options("PROJECTS")
+    first[0]["locations"].append("Roof")
+    second = manager.get_options("PROJECTS")
+    second.append({"id": "P2"})
+
+    assert manager.get_options("PROJECTS") == [{"id": "P1", "locations": ["Yard"]}]
+    assert manager.get_many(["PROJECTS"]) == {"PROJECTS": [{"id": "P1", "locations": ["Yard"]}]}
+
+
+@pytest.mark.unit
+def test_default_mutation_does_not_leak():
+    """Editing a returned default (e.g. a project's locations) leaves the defaults intact."""
+    manager = ConfigManager(table_name="test-reports")
+    manager.table.get_item.return_value = {}
+
+    projects = ConfigManager._get_defaults("PROJECTS")
+    projects[0]["locations"].append("Injected")
+    projects[0]["responsiblePersons"].clear()
+    severities = manager.get_options("SEVERITY_LEVELS")
+    severities.append("Extreme")
+
+    fresh = ConfigManager._get_defaults("PROJECTS")[0]
+    assert "Injected" not in fresh["locations"]
+    assert fresh["responsiblePersons"]
+    assert ConfigManager._get_defaults("SEVERITY_LEVELS") == ["High", "Medium", "Low"]
+
+
+@pytest.mark.unit
+def test_get_many_backs_off_on_unprocessed_keys(monkeypatch):
+    """UnprocessedKeys are retried with growing delays and a capped attempt count."""
+    from lambdas.shared import config_manager
+
+    sleeps = []
+    monkeypatch.setattr(config_manager.time, "sleep", sleeps.append)
+    manager = ConfigManager(table_name="test-reports")
+    unprocessed = {"test-reports": {"Keys": [{"PK": "CONFIG", "SK": "LOCATIONS"}]}}
+    manager.dynamodb.batch_get_item.return_value = {
+        "Responses": {"test-reports": []},
+        "UnprocessedKeys": unprocessed,
+    }
+
+    result = manager.get_many(["LOCATIONS"])
+
+    assert manager.dynamodb.batch_get_item.call_count == config_manager._BATCH_GET_MAX_ATTEMPTS
+    assert sleeps == sorted(sleeps) and len(sleeps) == config_manager._BATCH_GET_MAX_ATTEMPTS - 1
+    assert sleeps[-1] > sleeps[0]
+    # Defaults are served but not cached, so the next call tries DynamoDB again
+    assert result["LOCATIONS"] == ConfigManager._get_defaults("LOCATIONS")
+    assert ("test-reports", "LOCATIONS") not in config_manager._CONFIG_CACHE
+
+
+@pytest.mark.unit
+def test_cache_is_scoped_per_table():
+    """Managers on different tables never serve each other's cached options."""
+    default = ConfigManager(table_name="reports-a")
+    default.table.get_item.return_value = {"Item": {"values": ["Yard"]}}
+    assert default.get_options("LOCATIONS") == ["Yard"]
+
+    other = ConfigManager(table_name="reports-b")
+    other.table = MagicMock()
+    other.table.get_item.return_value = {"Item": {"values": ["Roof"]}}
+
+    assert other.get_options("LOCATIONS") == ["Roof"]
+    other.table.get_item.assert_called_once()
+    assert default.get_many(["LOCATIONS"]) == {"LOCATIONS": ["Yard"]}
+
+    other.invalidate("LOCATIONS")
+    assert default.get_options("LOCATIONS") == ["Yard"]
+    assert default.table.get_item.call_count == 1
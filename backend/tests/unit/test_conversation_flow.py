@@ -0,0 +1,97 @@
+"""End-to-end WhatsApp conversation flow against in-memory shared modules."""
+
+import pytest
+
+from tests.helpers.mock_shared import MockState
+
+
+USER_INPUT = {"imageUrl": "http://img", "description": "test"}
+
+
+@pytest.fixture
+def state_mgr():
+    return MockState()
+
+
+@pytest.mark.unit
+def test_new_user_flow(flow_handlers, state_mgr):
+    """New user: project prompt -> confirmations -> location."""
+    phone = "CLIENT_NEW"
+
+    flow_handlers.start_handler.handle_start(USER_INPUT, phone, state_mgr)
+    curr = state_mgr.get_state(phone)
+    assert curr["state"] == "WAITING_FOR_PROJECT"
+
+    flow_handlers.project_handler.handle_project_selection("Project Alpha", phone, state_mgr)
+    curr = state_mgr.get_state(phone)
+    assert curr["state"] == "WAITING_FOR_CONFIRMATION"
+    assert curr["draftData"]["projectId"] == "PROJ-A"
+
+    flow_handlers.confirmation_handler.handle_confirmation("Yes", phone, state_mgr, curr)
+    curr = state_mgr.get_state(phone)
+    assert curr["state"] == "WAITING_FOR_CATEGORY_CONFIRMATION"
+
+    flow_handlers.confirmation_handler.handle_category_confirmation("Yes", phone, state_mgr, curr)
+    curr = state_mgr.get_state(phone)
+    assert curr["state"] == "WAITING_FOR_LOCATION"
+
+    resp = flow_handlers.data_collection_handlers.handle_location("Alpha Loc 1", phone, state_mgr, curr)
+    assert "text" in resp
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "phone, expected_state, project_prompt",
+    [
+        ("CLIENT_NEW", "WAITING_FOR_PROJECT", None),
+        ("CLIENT_RETURNING", "WAITING_FOR_CONFIRMATION", "Project: *Project Alpha*"),
+    ],
+    ids=["new_user", "returning_user"],
+)
+def test_start_routes_on_last_project(flow_handlers, state_mgr, phone, expected_state, project_prompt):
+    """Users with a saved project skip project selection and see it pre-selected."""
+    resp = flow_handlers.start_handler.handle_start(USER_INPUT, phone, state_mgr)
+
+    assert state_mgr.get_state(phone)["state"] == expected_state
+    if project_prompt:
+        assert project_prompt in resp["text"]
+
+
+@pytest.mark.unit
+def test_change_project_flow(flow_handlers, state_mgr):
+    """'change_project' sends the user back to project selection."""
+    phone = "CLIENT_RETURNING"
+    curr = {"draftData": {"projectId": "PROJ-A", "observationType": "Unsafe Act", "hazardCategory": "A1 Hazard"}}
+    state_mgr.start_conversation(phone, "test-report", curr["draftData"], "WAITING_FOR_CONFIRMATION")
+
+    flow_handlers.confirmation_handler.handle_confirmation("change_project", phone, state_mgr, curr)
+    assert state_mgr.get_state(phone)["state"] == "WAITING_FOR_PROJECT"
+
+    flow_handlers.project_handler.handle_project_selection("Project Beta", phone, state_mgr)
+    assert state_mgr.get_state(phone)["draftData"]["projectId"] == "PROJ-B"
+
+
+@pytest.mark.unit
+def test_responsible_person_moves_to_notified_persons(flow_handlers, state_mgr):
+    """Responsible person is recorded and the notified-persons list is offered."""
+    final_data = {
+        "draftData": {
+            "imageId": "test-id",
+            "project": "Project Alpha",
+            "observationType": "Unsafe Act",
+            "hazardCategory": "Electrical Safety",
+            "location": "Site Office",
+            "breachSource": "Almabani",
+            "severity": "High",
+            "stopWork": True,
+            "imageUrl": "http://img.jpg",
+            "originalDescription": "Exposed wires"
+        }
+    }
+
+    resp = flow_handlers.finalization_handler.handle_responsible_person(
+        "Site Engineer A", "CLIENT_NEW", state_mgr, final_data
+    )
+
+    assert "notified" in resp["text"]
+    assert resp["interactive"]["type"] == "list"
@@ -1,89 +1,110 @@
-import os
-import sys
-from unittest.mock import MagicMock, patch
+from typing import Callable, Dict, Tuple
+from unittest.mock import MagicMock, create_autospec, patch
+import boto3
 import pytest
 
-# Add backend to path so we can import modules
-backend_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
-if backend_path not in sys.path:
-    sys.path.append(backend_path)
-
 from lambdas.shared.document_processing import DocumentProcessingService
 
+
+def _client_spec(service_name: str):
+    """Build a real (offline) botocore client to use as an autospec template."""
+    return boto3.session.Session(region_name="eu-west-1").client(service_name)
+
+
+# Spec'd mocks reject misspelled or removed client methods instead of
+# silently growing new child mocks.
+_CLIENT_SPECS = {name: _client_spec(name) for name in ("s3", "textract")}
+
+
+def _boto_side_effect() -> Tuple[Callable, Dict[str, MagicMock]]:
+    """Build a boto3.client stand-in that hands out one mock per service."""
+    mocks = {
+        name: create_autospec(spec, instance=True, spec_set=True)
+        for name, spec in _CLIENT_SPECS.items()
+    }
+
+    def get_client(service_name, *args, **kwargs):
+        return mocks[service_name]
+
+    return get_client, mocks
+
 class TestTextractFallback:
-    
+
+    @pytest.fixture(scope="class")
+    def service_bundle(self):
+        """Build one DocumentProcessingService (and its mocks) for the class."""
+        side, mocks = _boto_side_effect()
+        with pytest.MonkeyPatch.context() as mp, \
+             patch("lambdas.shared.document_processing.boto3.client", side_effect=side), \
+             patch("lambdas.shared.document_processing.PdfReader") as mock_reader:
+            mp.setenv("KB_BUCKET_NAME", "test-bucket")
+            service = DocumentProcessingService()
+            # Build the lazy Textract client while boto3.client is still patched
+            service._get_textract_client()
+            yield {"service": service, "reader": mock_reader, **mocks}
+
     @pytest.fixture
-    def mock_env(self, monkeypatch):
-        monkeypatch.setenv("KB_BUCKET_NAME", "test-bucket")
-
-    @patch("lambdas.shared.document_processing.boto3.client")
-    @patch("lambdas.shared.document_processing.PdfReader")
-    def test_text_heavy_pdf_bypasses_textract(self, mock_reader, mock_boto_client, mock_env):
-        """Test that a PDF with sufficient text does NOT trigger Textract."""
-        
-        # Setup Boto3 Mock
-        mock_s3 = MagicMock()
-        mock_textract = MagicMock()
-        def get_client(service_name):
-            if service_name == "s3": return mock_s3
-            if service_name == "textract": return mock_textract
-            return MagicMock()
-        mock_boto_client.side_effect = get_client
-        
-        # Setup PDF Logic (High text content)
-        mock_page = MagicMock()
-        mock_page.extract_text.return_value = "This is a detailed sentence with enough characters to pass the threshold." * 10
-        mock_reader.return_value.pages = [mock_page]
-        
-        service = DocumentProcessingService()
-        result, method = service._extract_pdf("dummy.pdf", s3_key="test.pdf")
-        
-        # Verify result structure
-        assert len(result) == 1
-        assert result[0]["type"] == "text"
-        assert method == "standard"
-        
-        # Verify Textract NOT called
-        mock_textract.start_document_text_detection.assert_not_called()
-
-    @patch("lambdas.shared.document_processing.boto3.client")
-    @patch("lambdas.shared.document_processing.PdfReader")
-    def test_scanned_pdf_triggers_textract(self, mock_reader, mock_boto_client, mock_env):
-        """Test that a PDF with low/no text triggers Textract."""
-
-        # Setup Boto3 Mock
-        mock_s3 = MagicMock()
-        mock_textract = MagicMock()
-        def get_client(service_name):
-            if service_name == "s3": return mock_s3
-            if service_name == "textract": return mock_textract
-            return MagicMock()
-        mock_boto_client.side_effect = get_client
-        
-        # Setup Textract Response
-        mock_textract.start_document_text_detection.return_value = {"JobId": "job-123"}
-        mock_textract.get_document_text_detection.side_effect = [
-            {"JobStatus": "IN_PROGRESS"},
-            {"JobStatus": "SUCCEEDED"}, # Polling loop successful
-            {"JobStatus": "SUCCEEDED", "Blocks": [ # Result retrieval loop
-                {"BlockType": "PAGE"},
-                {"BlockType": "LINE", "Text": "This text was extracted by Textract!"}
-            ]}
-        ]
-
-        # Setup PDF Logic (Empty/Low text)
+    def bundle(self, service_bundle):
+        """Clear per-test mock configuration on the shared service mocks."""
+        for name in ("s3", "textract", "reader"):
+            service_bundle[name].reset_mock(return_value=True, side_effect=True)
+        return service_bundle
+
+    @pytest.mark.parametrize(
+        "text, expected_method, textract_called, textract_blocks",
+        [
+            (
+                "This is a detailed sentence with enough characters to pass the threshold." * 10,
+                "standard",
+                False,
+                None,
+            ),
+            (
+                "",  # No text
+                "textract",
+                True,
+                [
+                    {"BlockType": "PAGE"},
+                    {"BlockType": "LINE", "Text": "This text was extracted by Textract!"},
+                ],
+            ),
+        ],
+        ids=["text_heavy", "scanned"],
+    )
+    def test_extract_pdf_routing(self, bundle, text, expected_method, textract_called, textract_blocks):
+        """Text-heavy PDFs use the standard reader; scanned PDFs fall back to Textract."""
+        mock_textract = bundle["textract"]
+        if textract_blocks is not None:
+            mock_textract.start_document_text_detection.return_value = {"JobId": "job-123"}
+            mock_textract.get_document_text_detection.return_value = {
+                "JobStatus": "SUCCEEDED",
+                "Blocks": textract_blocks,
+            }
+
         mock_page = MagicMock()
-        mock_page.extract_text.return_value = "" # No text
-        mock_reader.return_value.pages = [mock_page]
-        
-        service = DocumentProcessingService()
-        result, method = service._extract_pdf("dummy.pdf", s3_key="test.pdf")
-        
-        # Verify result content
+        mock_page.extract_text.return_value = text
+        bundle["reader"].return_value.pages = [mock_page]
+        mock_waiter = MagicMock()
+
+        with patch(
+            "lambdas.shared.document_processing.create_waiter_with_client",
+            return_value=mock_waiter,
+        ) as mock_create_waiter:
+            result, method = bundle["service"]._extract_pdf("dummy.pdf", s3_key="test.pdf")
+
         assert len(result) == 1
         assert result[0]["type"] == "text"
+        assert method == expected_method
+
+        if not textract_called:
+            mock_textract.start_document_text_detection.assert_not_called()
+            mock_create_waiter.assert_not_called()
+            return
+
+        # Textract was started, waited on once, and read once
         assert "This text was extracted by Textract!" in result[0]["content"]
-        assert method == "textract"
-        
-        # Verify Textract WAS called
         mock_textract.start_document_text_detection.assert_called_once()
+        assert mock_create_waiter.call_args.args[0] == "DocumentTextDetectionComplete"
+        assert mock_create_waiter.call_args.args[2] is mock_textract
+        mock_waiter.wait.assert_called_once_with(JobId="job-123")
+        mock_textract.get_document_text_detection.assert_called_once_with(JobId="job-123")
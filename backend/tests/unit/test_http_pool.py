@@ -0,0 +1,86 @@
+"""Unit tests for the shared urllib3 HTTP helpers."""
+
+import base64
+import json
+from unittest.mock import patch
+
+import pytest
+import urllib3
+
+from lambdas.shared import http_pool
+from lambdas.shared.http_pool import (
+    HTTPStatusError,
+    basic_auth_headers,
+    post_form,
+    post_json,
+    raise_for_status,
+    response_json,
+)
+
+
+def _response(status, body=b""):
+    return urllib3.HTTPResponse(body=body, status=status, preload_content=True)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("status", [200, 201, 302, 399])
+def test_raise_for_status_passes_non_errors(status):
+    """Non-error statuses are left alone."""
+    assert raise_for_status(_response(status)) is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("status", [400, 401, 404, 500, 503])
+def test_raise_for_status_raises_with_status_and_body(status):
+    """4xx/5xx responses raise HTTPStatusError carrying the status and decoded body."""
+    with pytest.raises(HTTPStatusError) as excinfo:
+        raise_for_status(_response(status, b'{"message": "nope \xff"}'))
+
+    assert excinfo.value.status == status
+    assert excinfo.value.body == '{"message": "nope �"}'
+    assert str(excinfo.value).startswith(f"HTTP {status}: ")
+
+
+@pytest.mark.unit
+def test_response_json_decodes_body():
+    """JSON bodies are decoded from the raw bytes."""
+    assert response_json(_response(200, b'{"sid": "SM1"}')) == {"sid": "SM1"}
+
+
+@pytest.mark.unit
+def test_basic_auth_headers():
+    """Credentials are encoded as a Basic Authorization header."""
+    headers = basic_auth_headers("AC123", "secret:token")
+
+    scheme, encoded = headers["authorization"].split(" ")
+    assert scheme == "Basic"
+    assert base64.b64decode(encoded).decode() == "AC123:secret:token"
+
+
+@pytest.mark.unit
+def test_post_form_sends_urlencoded_fields():
+    """post_form goes through the shared pool as a url-encoded form POST."""
+    with patch.object(http_pool.HTTP, "request") as request:
+        result = post_form("https://api.example/Messages.json", {"To": "+1", "Body": "hi"}, headers={"x": "1"})
+
+    request.assert_called_once_with(
+        "POST",
+        "https://api.example/Messages.json",
+        fields={"To": "+1", "Body": "hi"},
+        headers={"x": "1"},
+        encode_multipart=False,
+    )
+    assert result is request.return_value
+
+
+@pytest.mark.unit
+def test_post_json_serializes_and_sets_content_type():
+    """post_json sends a JSON body and keeps caller headers alongside Content-Type."""
+    with patch.object(http_pool.HTTP, "request") as request:
+        post_json("https://api.example/hook", {"a": [1, 2]}, headers={"authorization": "Basic x"})
+
+    method, url = request.call_args.args
+    kwargs = request.call_args.kwargs
+    assert (method, url) == ("POST", "https://api.example/hook")
+    assert json.loads(kwargs["body"]) == {"a": [1, 2]}
+    assert kwargs["headers"] == {"authorization": "Basic x", "Content-Type": "application/json"}
@@ -2,57 +2,55 @@
 
 import pytest
 import json
-from unittest.mock import patch
 
 from lambdas.items import create_item, get_user_items
 from tests.helpers.lambda_test_helpers import (
     assert_api_response,
     assert_error_response,
+    event_with,
 )
 
+_CREATE_OK_BODY = json.dumps({"title": "Test Item", "description": "Test Description"})
+_CREATE_MISSING_DESC_BODY = json.dumps({"title": "Test Item"})
+
+
+# Patched once for the whole module by conftest._patched_table
+TABLE_PATCH_TARGET = "lambdas.items.table"
 
-@pytest.mark.unit
-def test_create_item_unauthorized(mock_lambda_context, api_gateway_event):
-    """Test create item without authentication."""
-    api_gateway_event["httpMethod"] = "POST"
-    api_gateway_event["body"] = json.dumps({"title": "Test", "description": "Test"})
 
-    response = create_item(api_gateway_event, mock_lambda_context)
+@pytest.mark.unit
+@pytest.mark.parametrize("handler", [create_item, get_user_items], ids=["create", "list"])
+def test_items_unauthorized(handler, mock_lambda_context, mutable_api_gateway_event):
+    """Test items endpoints without authentication."""
+    response = handler(mutable_api_gateway_event, mock_lambda_context)
 
-    assert_error_response(response, expected_status=401)
+    body = assert_error_response(response, expected_status=401)
+    assert body["error"] == "Unauthorized"
 
 
 @pytest.mark.unit
 def test_create_item_missing_fields(mock_lambda_context, authenticated_event):
     """Test create item with missing required fields."""
-    authenticated_event["httpMethod"] = "POST"
-    authenticated_event["body"] = json.dumps(
-        {"title": "Test Item"}
-    )  # Missing description
+    event = event_with(
+        authenticated_event, httpMethod="POST", body=_CREATE_MISSING_DESC_BODY
+    )
 
-    response = create_item(authenticated_event, mock_lambda_context)
+    response = create_item(event, mock_lambda_context)
 
     body = assert_error_response(response, expected_status=400)
     assert "description" in body.get("details", {}).get("missing_fields", [])
 
 
 @pytest.mark.unit
-@patch("lambdas.items.table")
 def test_create_item_success(
     mock_table, mock_lambda_context, authenticated_event, sample_item_data
 ):
     """Test successful item creation."""
     mock_table.put_item.return_value = {}
 
-    authenticated_event["httpMethod"] = "POST"
-    authenticated_event["body"] = json.dumps(
-        {
-            "title": sample_item_data["title"],
-            "description": sample_item_data["description"],
-        }
-    )
+    event = event_with(authenticated_event, httpMethod="POST", body=_CREATE_OK_BODY)
 
-    response = create_item(authenticated_event, mock_lambda_context)
+    response = create_item(event, mock_lambda_context)
 
     body = assert_api_response(response, expected_status=201)
     assert "itemId" in body
@@ -60,7 +58,6 @@ def test_create_item_success(
 
 
 @pytest.mark.unit
-@patch("lambdas.items.table")
 def test_get_user_items_success(
     mock_table, mock_lambda_context, authenticated_event, sample_item_data
 ):
@@ -70,9 +67,9 @@ def test_get_user_items_success(
         "Count": 1,
     }
 
-    authenticated_event["httpMethod"] = "GET"
+    event = event_with(authenticated_event, httpMethod="GET")
 
-    response = get_user_items(authenticated_event, mock_lambda_context)
+    response = get_user_items(event, mock_lambda_context)
 
     body = assert_api_response(response, expected_status=200)
     assert len(body["items"]) == 1
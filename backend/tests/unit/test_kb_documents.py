@@ -0,0 +1,91 @@
+"""Unit tests for knowledge base document Lambda functions."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lambdas import kb_documents
+from lambdas.shared.kb_repositories import DocumentRepository
+from tests.helpers.lambda_test_helpers import assert_api_response, event_with
+
+_CONFIRM_BODY = json.dumps(
+    {
+        "documentId": "doc-1",
+        "s3Key": "documents/owner-1/kb-1/doc-1/manual.pdf",
+        "filename": "manual.pdf",
+        "fileType": "pdf",
+        "fileSize": 2048,
+    }
+)
+
+
+@pytest.fixture
+def upload_deps():
+    """Real DocumentRepository over a mock client; KB repository and SQS mocked."""
+    kb_repository = MagicMock(table_name="test-kb-table")
+    kb_repository.get_by_id.return_value = {"kbId": "kb-1", "userId": "owner-1"}
+    document_repository = DocumentRepository()
+    document_repository.table = MagicMock()
+    document_repository._client = MagicMock()
+    sqs_client = MagicMock()
+
+    # One parent mock records the relative order of the DynamoDB and SQS calls
+    calls = MagicMock()
+    calls.attach_mock(document_repository._client.transact_write_items, "transact")
+    calls.attach_mock(sqs_client.send_message, "send_message")
+
+    with patch.multiple(
+        kb_documents,
+        _kb_repository=kb_repository,
+        _document_repository=document_repository,
+        _sqs_client=sqs_client,
+    ):
+        yield document_repository, sqs_client, calls
+
+
+@pytest.fixture
+def confirm_event(authenticated_event):
+    return event_with(
+        authenticated_event,
+        httpMethod="POST",
+        pathParameters={"kbId": "kb-1"},
+        body=_CONFIRM_BODY,
+    )
+
+
+@pytest.mark.unit
+def test_confirm_upload_writes_stats_before_queueing(upload_deps, confirm_event, mock_lambda_context):
+    """Status and KB stats are written in one transaction, before the indexing message."""
+    document_repository, _sqs_client, calls = upload_deps
+
+    response = kb_documents.confirm_document_upload(confirm_event, mock_lambda_context)
+
+    assert_api_response(response, expected_status=201)
+    assert [name for name, _args, _kwargs in calls.mock_calls] == ["transact", "send_message"]
+
+    transact_items = document_repository._client.transact_write_items.call_args.kwargs["TransactItems"]
+    document_update, kb_update = (item["Update"] for item in transact_items)
+    assert document_update["TableName"] == "test-docs-table"
+    assert document_update["Key"] == {"kbId": {"S": "kb-1"}, "documentId": {"S": "doc-1"}}
+    assert document_update["ExpressionAttributeValues"][":status"] == {"S": "processing"}
+    assert kb_update["TableName"] == "test-kb-table"
+    assert kb_update["Key"] == {"userId": {"S": "owner-1"}, "kbId": {"S": "kb-1"}}
+    assert kb_update["ExpressionAttributeValues"][":inc"] == {"N": "1"}
+    assert kb_update["ExpressionAttributeValues"][":size"] == {"N": "2048"}
+    assert (
+        document_update["ExpressionAttributeValues"][":timestamp"]
+        == kb_update["ExpressionAttributeValues"][":timestamp"]
+    )
+
+
+@pytest.mark.unit
+def test_confirm_upload_failed_transaction_does_not_queue(upload_deps, confirm_event, mock_lambda_context):
+    """If the transaction fails, no indexing job is queued for an uncounted document."""
+    document_repository, sqs_client, _calls = upload_deps
+    document_repository._client.transact_write_items.side_effect = RuntimeError("cancelled")
+
+    response = kb_documents.confirm_document_upload(confirm_event, mock_lambda_context)
+
+    assert response["statusCode"] == 500
+    sqs_client.send_message.assert_not_called()
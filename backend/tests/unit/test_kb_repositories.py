@@ -0,0 +1,142 @@
+"""Unit tests for the knowledge base / document repositories' low-level writes."""
+
+from decimal import Decimal
+from unittest.mock import ANY, MagicMock
+
+import pytest
+
+from lambdas.shared import aws_clients
+from lambdas.shared.kb_repositories import DocumentRepository, KnowledgeBaseRepository
+
+
+@pytest.mark.unit
+def test_repositories_share_configured_client(mock_aws_services):
+    """Both repositories reuse the process-wide client built with the shared Config."""
+    kb_repository = KnowledgeBaseRepository()
+    document_repository = DocumentRepository()
+
+    assert kb_repository._client is document_repository._client
+    assert kb_repository._client is aws_clients.get_dynamodb_client()
+    mock_aws_services.assert_any_call("dynamodb", config=aws_clients.get_client_config())
+
+
+@pytest.mark.unit
+def test_update_status_builds_typed_update_and_deserializes():
+    """update_status sends DynamoDB-JSON values and returns plain Python attributes."""
+    repository = DocumentRepository()
+    repository._client.update_item.return_value = {
+        "Attributes": {
+            "kbId": {"S": "kb-1"},
+            "documentId": {"S": "doc-1"},
+            "status": {"S": "processed"},
+            "chunkCount": {"N": "12"},
+            "extractionMethod": {"S": "textract"},
+        }
+    }
+
+    result = repository.update_status(
+        kb_id="kb-1",
+        document_id="doc-1",
+        status="processed",
+        chunk_count=12,
+        extraction_method="textract",
+        error_message="partial OCR",
+    )
+
+    repository._client.update_item.assert_called_once_with(
+        TableName="test-docs-table",
+        Key={"kbId": {"S": "kb-1"}, "documentId": {"S": "doc-1"}},
+        UpdateExpression=(
+            "SET #status = :status, processedAt = :timestamp, "
+            "chunkCount = :chunk_count, extractionMethod = :extraction_method, "
+            "errorMessage = :error"
+        ),
+        ExpressionAttributeNames={"#status": "status"},
+        ExpressionAttributeValues={
+            ":status": {"S": "processed"},
+            ":timestamp": {"N": ANY},
+            ":chunk_count": {"N": "12"},
+            ":extraction_method": {"S": "textract"},
+            ":error": {"S": "partial OCR"},
+        },
+        ReturnValues="ALL_NEW",
+    )
+    assert result == {
+        "kbId": "kb-1",
+        "documentId": "doc-1",
+        "status": "processed",
+        "chunkCount": Decimal("12"),
+        "extractionMethod": "textract",
+    }
+
+
+@pytest.mark.unit
+def test_update_status_omits_optional_fields():
+    """Only status and processedAt are set when nothing else is given."""
+    repository = DocumentRepository()
+    repository._client.update_item.return_value = {}
+
+    assert repository.update_status(kb_id="kb-1", document_id="doc-1", status="failed") == {}
+
+    kwargs = repository._client.update_item.call_args.kwargs
+    assert kwargs["UpdateExpression"] == "SET #status = :status, processedAt = :timestamp"
+    assert set(kwargs["ExpressionAttributeValues"]) == {":status", ":timestamp"}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "method, count_key, count, size",
+    [
+        ("increment_document_stats", ":inc", "1", "512"),
+        ("decrement_document_stats", ":dec", "-1", "-512"),
+    ],
+    ids=["increment", "decrement"],
+)
+def test_document_stats_updates(method, count_key, count, size):
+    """Stats changes are atomic ADDs with signed number values."""
+    repository = KnowledgeBaseRepository()
+
+    getattr(repository, method)(user_id="owner-1", kb_id="kb-1", size=512)
+
+    kwargs = repository._client.update_item.call_args.kwargs
+    assert kwargs["TableName"] == "test-kb-table"
+    assert kwargs["Key"] == {"userId": {"S": "owner-1"}, "kbId": {"S": "kb-1"}}
+    assert kwargs["UpdateExpression"].startswith("ADD documentCount ")
+    values = kwargs["ExpressionAttributeValues"]
+    assert values[count_key] == {"N": count}
+    assert values[":size"] == {"N": size}
+
+
+@pytest.mark.unit
+def test_kb_index_lock_condition_uses_typed_values():
+    """The KB index lock is a conditional update with an expiry computed from the TTL."""
+    repository = KnowledgeBaseRepository()
+
+    assert repository.update_index_lock(kb_id="kb-1", user_id="owner-1", lock_id="lock-1", ttl_seconds=60)
+
+    values = repository._client.update_item.call_args.kwargs["ExpressionAttributeValues"]
+    assert values[":lock"] == {"S": "lock-1"}
+    assert values[":empty"] == {"S": ""}
+    assert int(values[":time"]["N"]) - int(values[":expiry"]["N"]) == 60_000
+
+    repository._client.update_item.side_effect = Exception("ConditionalCheckFailed")
+    assert not repository.update_index_lock(kb_id="kb-1", user_id="owner-1", lock_id="lock-2")
+
+
+@pytest.mark.unit
+def test_document_index_lock_goes_through_client():
+    """Document lock acquire/release use the shared client, not the resource table."""
+    repository = DocumentRepository()
+    repository.table = MagicMock()
+
+    assert repository.update_index_lock(kb_id="kb-1", user_id="owner-1", lock_id="lock-1", ttl_seconds=60)
+    repository.release_index_lock(kb_id="kb-1", user_id="owner-1", lock_id="lock-1")
+
+    acquire, release = (call.kwargs for call in repository._client.update_item.call_args_list)
+    assert acquire["TableName"] == release["TableName"] == "test-docs-table"
+    assert acquire["Key"] == release["Key"] == {"userId": {"S": "owner-1"}, "kbId": {"S": "kb-1"}}
+    assert int(acquire["ExpressionAttributeValues"][":time"]["N"]) - int(
+        acquire["ExpressionAttributeValues"][":expiry"]["N"]
+    ) == 60_000
+    assert release["ExpressionAttributeValues"] == {":lock": {"S": "lock-1"}}
+    repository.table.update_item.assert_not_called()
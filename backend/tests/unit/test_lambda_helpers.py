@@ -0,0 +1,27 @@
+"""Unit tests for the shared Lambda helper functions."""
+
+import pytest
+
+from lambdas.shared.lambda_helpers import create_response
+
+
+@pytest.mark.unit
+def test_response_headers_are_private_per_response():
+    """Headers added to one response (CORS, cookies) never show up on the next."""
+    first = create_response(200, {"ok": True})
+    first["headers"]["Set-Cookie"] = "session=abc"
+
+    second = create_response(200, {"ok": True})
+
+    assert "Set-Cookie" not in second["headers"]
+    assert second["headers"]["Content-Type"] == "application/json"
+
+
+@pytest.mark.unit
+def test_custom_headers_merge_over_defaults():
+    """Caller headers override or extend the defaults."""
+    response = create_response(201, {}, headers={"Content-Type": "text/plain", "X-Id": "1"})
+
+    assert response["headers"]["Content-Type"] == "text/plain"
+    assert response["headers"]["X-Id"] == "1"
+    assert response["headers"]["Access-Control-Allow-Origin"] == "*"
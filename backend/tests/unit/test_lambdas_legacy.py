@@ -1,8 +1,13 @@
 import pytest
 import json
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 from lambdas.user_profile import health_check, get_user_profile, update_user_profile
 from lambdas.items import create_item, get_user_items, update_item, delete_item
+from tests.helpers.lambda_test_helpers import assert_api_response
+
+
+# Patched once for the whole module by conftest._patched_table
+TABLE_PATCH_TARGET = "lambdas.user_profile.table"
 
 
 def test_health_check():
@@ -12,26 +17,12 @@ def test_health_check():
 
     response = health_check(event, context)
 
-    assert response["statusCode"] == 200
-    body = json.loads(response["body"])
+    body = assert_api_response(response, expected_status=200)
     assert body["status"] == "healthy"
     assert "timestamp" in body
     assert body["service"] == "taskflow-backend"
 
 
-def test_get_user_profile_unauthorized():
-    """Test get user profile without authentication."""
-    event = {}
-    context = {}
-
-    response = get_user_profile(event, context)
-
-    assert response["statusCode"] == 401
-    body = json.loads(response["body"])
-    assert body["error"] == "Unauthorized"
-
-
-@patch("lambdas.user_profile.table")
 def test_get_user_profile_success(mock_table):
     """Test successful get user profile."""
     mock_table.get_item.return_value = {
@@ -49,24 +40,11 @@ def test_get_user_profile_success(mock_table):
 
     response = get_user_profile(event, context)
 
-    assert response["statusCode"] == 200
-    body = json.loads(response["body"])
+    body = assert_api_response(response, expected_status=200)
     assert body["userId"] == "test-user"
     assert body["email"] == "test@example.com"
 
 
-def test_create_item_unauthorized():
-    """Test create item without authentication."""
-    event = {}
-    context = {}
-
-    response = create_item(event, context)
-
-    assert response["statusCode"] == 401
-    body = json.loads(response["body"])
-    assert body["error"] == "Unauthorized"
-
-
 def test_create_item_missing_fields():
     """Test create item with missing required fields."""
     event = {
@@ -82,7 +60,6 @@ def test_create_item_missing_fields():
 
     response = create_item(event, context)
 
-    assert response["statusCode"] == 400
-    body = json.loads(response["body"])
+    body = assert_api_response(response, expected_status=400)
     assert body["error"] == "Missing required fields"
     assert "description" in body["details"]["missing_fields"]
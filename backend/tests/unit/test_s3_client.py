@@ -0,0 +1,99 @@
+"""Unit tests for streaming Twilio media into S3."""
+
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+import urllib3
+
+from lambdas.shared import s3_client as s3_module
+from lambdas.shared.http_pool import HTTPStatusError
+from lambdas.shared.s3_client import S3Client
+
+_IMAGE = b"\x89PNG" + b"x" * 10_000
+
+
+def _streaming_response(status=200, body=_IMAGE, content_type="image/png; charset=binary"):
+    response = urllib3.HTTPResponse(
+        body=io.BytesIO(body),
+        status=status,
+        headers={"Content-Type": content_type},
+        preload_content=False,
+    )
+    response.release_conn = MagicMock()
+    return response
+
+
+def _drain(fileobj, **_kwargs):
+    """Read the upload stream in chunks, the way the S3 transfer manager does."""
+    while fileobj.read(4096):
+        pass
+
+
+@pytest.fixture
+def client():
+    with patch.object(
+        s3_module, "get_twilio_credentials", return_value={"account_sid": "AC1", "auth_token": "tok"}
+    ):
+        yield S3Client()
+
+
+@pytest.mark.unit
+def test_upload_image_streams_and_counts_bytes(client):
+    """The download is streamed into upload_fileobj and its size counted on the way."""
+    response = _streaming_response()
+    client.s3_client.upload_fileobj.side_effect = _drain
+
+    with patch.object(s3_module.HTTP, "request", return_value=response) as request:
+        result = client.upload_image("https://api.twilio.com/media/ME1", "req-1", {"sender": "Zoë", "empty": ""})
+
+    assert request.call_args.kwargs["preload_content"] is False
+    assert request.call_args.kwargs["headers"]["authorization"].startswith("Basic ")
+    assert result["size"] == len(_IMAGE)
+    assert result["s3Key"].endswith("/req-1.png")
+    assert result["contentType"] == "image/png; charset=binary"
+
+    kwargs = client.s3_client.upload_fileobj.call_args.kwargs
+    assert kwargs["Key"] == result["s3Key"]
+    assert kwargs["ExtraArgs"]["Metadata"] == {"sender": "Zo"}
+    assert kwargs["Config"].multipart_threshold == 5 * 1024 * 1024
+    response.release_conn.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "content_type, extension",
+    [("image/jpeg", ".jpg"), ("IMAGE/WEBP", ".webp"), ("image/gif", ".gif"), ("application/octet-stream", ".jpg")],
+)
+def test_upload_image_key_extension(client, content_type, extension):
+    """The key extension follows the media content type, defaulting to .jpg."""
+    with patch.object(s3_module.HTTP, "request", return_value=_streaming_response(content_type=content_type)):
+        result = client.upload_image("https://media", "req-2", {})
+
+    assert result["s3Key"].endswith(f"/req-2{extension}")
+
+
+@pytest.mark.unit
+def test_upload_image_releases_connection_on_http_error(client):
+    """An error status raises before uploading and still returns the connection."""
+    response = _streaming_response(status=404, body=b"not found")
+
+    with patch.object(s3_module.HTTP, "request", return_value=response):
+        with pytest.raises(HTTPStatusError):
+            client.upload_image("https://media", "req-3", {})
+
+    client.s3_client.upload_fileobj.assert_not_called()
+    response.release_conn.assert_called_once()
+
+
+@pytest.mark.unit
+def test_upload_image_releases_connection_on_upload_error(client):
+    """A failed S3 upload propagates and still returns the connection to the pool."""
+    response = _streaming_response()
+    client.s3_client.upload_fileobj.side_effect = RuntimeError("S3 down")
+
+    with patch.object(s3_module.HTTP, "request", return_value=response):
+        with pytest.raises(RuntimeError):
+            client.upload_image("https://media", "req-4", {})
+
+    response.release_conn.assert_called_once()
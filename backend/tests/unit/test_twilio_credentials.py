@@ -0,0 +1,76 @@
+"""Unit tests for the cached Twilio credential lookup."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from lambdas.shared import twilio_credentials
+from lambdas.shared.twilio_credentials import get_twilio_credentials
+
+_PARAMETERS = {
+    "Parameters": [
+        {"Name": "/mabani/twilio/account_sid", "Value": "AC123"},
+        {"Name": "/mabani/twilio/auth_token", "Value": "secret"},
+    ]
+}
+
+
+@pytest.fixture
+def ssm(monkeypatch):
+    client = MagicMock()
+    client.get_parameters_by_path.return_value = _PARAMETERS
+    monkeypatch.setattr(twilio_credentials, "get_ssm_client", lambda: client)
+    return client
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(twilio_credentials.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.mark.unit
+def test_credentials_cached_within_ttl(ssm, clock):
+    """Lookups inside the TTL reuse the first Parameter Store fetch."""
+    first = get_twilio_credentials(ttl=60)
+    clock[0] += 59
+    second = get_twilio_credentials(ttl=60)
+
+    assert first == {"account_sid": "AC123", "auth_token": "secret"}
+    assert second is first
+    ssm.get_parameters_by_path.assert_called_once_with(
+        Path="/mabani/twilio", Recursive=True, WithDecryption=True
+    )
+
+
+@pytest.mark.unit
+def test_credentials_refetched_after_ttl(ssm, clock):
+    """Once the cache is older than the TTL, Parameter Store is read again."""
+    get_twilio_credentials(ttl=60)
+    clock[0] += 60
+    ssm.get_parameters_by_path.return_value = {
+        "Parameters": [{"Name": "/mabani/twilio/auth_token", "Value": "rotated"}]
+    }
+
+    assert get_twilio_credentials(ttl=60) == {"auth_token": "rotated"}
+    assert ssm.get_parameters_by_path.call_count == 2
+
+
+@pytest.mark.unit
+def test_failed_fetch_is_not_cached(ssm, clock):
+    """Errors and empty paths propagate and leave the cache empty for the next call."""
+    ssm.get_parameters_by_path.side_effect = ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "slow down"}}, "GetParametersByPath"
+    )
+    with pytest.raises(ClientError):
+        get_twilio_credentials()
+
+    ssm.get_parameters_by_path.side_effect = None
+    ssm.get_parameters_by_path.return_value = {"Parameters": []}
+    with pytest.raises(ValueError):
+        get_twilio_credentials()
+
+    ssm.get_parameters_by_path.return_value = _PARAMETERS
+    assert get_twilio_credentials()["account_sid"] == "AC123"
@@ -2,14 +2,20 @@
 
 import pytest
 import json
-from unittest.mock import patch
 
 from lambdas.user_profile import health_check, get_user_profile, update_user_profile
 from tests.helpers.lambda_test_helpers import (
     assert_api_response,
     assert_error_response,
+    event_with,
 )
 
+_UPDATE_NAME_BODY = json.dumps({"name": "Updated Name"})
+
+
+# Patched once for the whole module by conftest._patched_table
+TABLE_PATCH_TARGET = "lambdas.user_profile.table"
+
 
 @pytest.mark.unit
 def test_health_check(mock_lambda_context):
@@ -25,15 +31,20 @@ def test_health_check(mock_lambda_context):
 
 
 @pytest.mark.unit
-def test_get_user_profile_unauthorized(mock_lambda_context, api_gateway_event):
-    """Test get user profile without authentication."""
-    response = get_user_profile(api_gateway_event, mock_lambda_context)
+@pytest.mark.parametrize(
+    "handler", [get_user_profile, update_user_profile], ids=["get", "update"]
+)
+def test_user_profile_unauthorized(
+    handler, mock_lambda_context, mutable_api_gateway_event
+):
+    """Test user profile endpoints without authentication."""
+    response = handler(mutable_api_gateway_event, mock_lambda_context)
 
-    assert_error_response(response, expected_status=401)
+    body = assert_error_response(response, expected_status=401)
+    assert body["error"] == "Unauthorized"
 
 
 @pytest.mark.unit
-@patch("lambdas.user_profile.table")
 def test_get_user_profile_success(
     mock_table, mock_lambda_context, authenticated_event, sample_user_data
 ):
@@ -48,7 +59,6 @@ def test_get_user_profile_success(
 
 
 @pytest.mark.unit
-@patch("lambdas.user_profile.table")
 def test_update_user_profile_success(
     mock_table, mock_lambda_context, authenticated_event, sample_user_data
 ):
@@ -58,10 +68,9 @@ def test_update_user_profile_success(
         "Attributes": {**sample_user_data, "name": "Updated Name"}
     }
 
-    authenticated_event["httpMethod"] = "PUT"
-    authenticated_event["body"] = json.dumps({"name": "Updated Name"})
+    event = event_with(authenticated_event, httpMethod="PUT", body=_UPDATE_NAME_BODY)
 
-    response = update_user_profile(authenticated_event, mock_lambda_context)
+    response = update_user_profile(event, mock_lambda_context)
 
     body = assert_api_response(response, expected_status=200)
     assert body["name"] == "Updated Name"
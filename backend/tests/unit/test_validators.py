@@ -0,0 +1,41 @@
+"""Unit tests for report classification in the shared validators."""
+
+import pytest
+
+from lambdas.shared import validators
+from lambdas.shared.validators import determine_report_type
+
+
+@pytest.fixture(params=["automaton", "substring"])
+def matcher(request, monkeypatch):
+    """Run each case with the Aho-Corasick matcher and the plain substring fallback."""
+    if request.param == "automaton" and validators._KEYWORD_AUTOMATON is None:
+        pytest.skip("pyahocorasick is not installed")
+    if request.param == "substring":
+        monkeypatch.setattr(validators, "_KEYWORD_AUTOMATON", None)
+    return request.param
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "description, expected",
+    [
+        # Majority scoring decides whenever the scores differ
+        ("Poor quality finish, out of tolerance after installation; minor injury", "QUALITY"),
+        ("Unsafe scaffold, fall risk, no PPE; workmanship is poor", "HS"),
+        ("Rework needed but the safety risk comes first", "HS"),
+        ("Worker injury near the crane", "HS"),
+        ("Defect in slab finish", "QUALITY"),
+        # Tied scores default to H&S, whatever the keywords
+        ("Defect found on lifting equipment", "HS"),
+        ("Accident during installation", "HS"),
+        ("Paint finish near equipment", "HS"),
+        ("Defect reported after the incident", "HS"),
+        # Nothing matched defaults to H&S
+        ("", "HS"),
+        ("Site photo", "HS"),
+    ],
+)
+def test_determine_report_type(matcher, description, expected):
+    """Keyword majority wins; ties and no matches default to H&S."""
+    assert determine_report_type(description) == expected
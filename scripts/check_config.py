@@ -1,34 +1,69 @@
 
 import boto3
+from botocore.exceptions import BotoCoreError, ClientError
 import json
 import os
+import time
+from functools import lru_cache
 
 TABLE_NAME = "taskflow-backend-dev-reports"
 AWS_PROFILE = "mia40"
 AWS_REGION = "eu-west-1"
+# Every row comes back from a single BatchGetItem (up to 100 keys per call),
+# so there are no per-key round trips for async I/O to overlap.
+CONFIG_SKS = ("PROJECTS", "LOCATIONS", "HAZARD_TAXONOMY")
+# UnprocessedKeys retries: exponential backoff, capped attempts
+BATCH_GET_MAX_ATTEMPTS = 5
+BATCH_GET_BASE_DELAY = 0.05
 
-def check_config():
+
+@lru_cache(maxsize=None)
+def get_dynamodb():
+    """Create the DynamoDB resource once and reuse it for every lookup."""
     session = boto3.Session(profile_name=AWS_PROFILE, region_name=AWS_REGION)
-    dynamodb = session.resource('dynamodb')
-    table = dynamodb.Table(TABLE_NAME)
-    
-    print(f"Fetching CONFIG/PROJECTS from {TABLE_NAME}...")
-    
+    return session.resource('dynamodb')
+
+
+def check_config():
+    dynamodb = get_dynamodb()
+
+    print(f"Fetching CONFIG/{', '.join(CONFIG_SKS)} from {TABLE_NAME}...")
+
     try:
-        response = table.get_item(
-            Key={
-                "PK": "CONFIG",
-                "SK": "PROJECTS"
-            }
-        )
-        item = response.get("Item")
-        if item:
-            print("Found Item:")
-            print(json.dumps(item.get("values", "NO_VALUES"), indent=2, default=str))
-        else:
-            print("Item NOT FOUND (will use defaults).")
-            
-    except Exception as e:
+        # One BatchGetItem round-trip for every CONFIG row
+        request = {
+            TABLE_NAME: {"Keys": [{"PK": "CONFIG", "SK": sk} for sk in CONFIG_SKS]}
+        }
+        items = {}
+        for attempt in range(BATCH_GET_MAX_ATTEMPTS):
+            if attempt:
+                # UnprocessedKeys means throttling; back off before retrying
+                time.sleep(BATCH_GET_BASE_DELAY * (2 ** (attempt - 1)))
+            response = dynamodb.batch_get_item(RequestItems=request)
+            if response is None or response.get("ResponseMetadata", {}).get("HTTPStatusCode") != 200:
+                print("Error: unexpected BatchGetItem response")
+                return
+            for item in response.get("Responses", {}).get(TABLE_NAME, []):
+                items[item["SK"]] = item
+            request = response.get("UnprocessedKeys")
+            if not request:
+                break
+
+        unprocessed = {
+            key["SK"] for key in (request or {}).get(TABLE_NAME, {}).get("Keys", [])
+        }
+
+        for sk in CONFIG_SKS:
+            item = items.get(sk)
+            if sk in unprocessed:
+                print(f"CONFIG/{sk} NOT READ: still unprocessed after {BATCH_GET_MAX_ATTEMPTS} attempts (throttled).")
+            elif item:
+                print(f"Found CONFIG/{sk}:")
+                print(json.dumps(item.get("values", "NO_VALUES"), indent=2, default=str))
+            else:
+                print(f"CONFIG/{sk} NOT FOUND (will use defaults).")
+
+    except (BotoCoreError, ClientError) as e:
         print(f"Error: {e}")
 
 if __name__ == "__main__":
@@ -1,39 +1,54 @@
 
 import boto3
+from boto3.dynamodb.conditions import Attr
+from concurrent.futures import ThreadPoolExecutor
 import os
 
 # Configuration
 TABLE_NAME = "taskflow-backend-dev-reports"
 REGION = "eu-west-1"
+# The reports table has no index keyed on SK (GSI1/GSI2 are project/sender),
+# so the scan is split into segments that run in parallel instead.
+TOTAL_SEGMENTS = 8
 
-def cleanup_logs():
-    dynamodb = boto3.resource("dynamodb", region_name=REGION)
+def cleanup_segment(segment, total_segments=TOTAL_SEGMENTS):
+    # boto3 resources are not thread-safe, so each worker builds its own
+    dynamodb = boto3.session.Session().resource("dynamodb", region_name=REGION)
     table = dynamodb.Table(TABLE_NAME)
-    
-    print(f"Scanning table {TABLE_NAME} for logs without 'reportNumber'...")
-    
-    # Scan for items where reportNumber is missing
-    # We will scan all items and filter in python to be safe, 
-    # or use FilterExpression attribute_not_exists(reportNumber)
-    
-    response = table.scan()
-    items = response.get("Items", [])
-    
+
+    # Let DynamoDB filter report metadata rows whose reportNumber is missing or
+    # NULL, and only ship back the key attributes needed to delete them.
+    scan_kwargs = {
+        "Segment": segment,
+        "TotalSegments": total_segments,
+        "FilterExpression": Attr("SK").eq("METADATA") & (
+            Attr("reportNumber").not_exists() | Attr("reportNumber").attribute_type("NULL")
+        ),
+        "ProjectionExpression": "PK, SK",
+    }
+
     deleted_count = 0
-    
-    for item in items:
-        # Check if it's a report metadata item
-        if item.get("SK") == "METADATA":
-            # Check if reportNumber is missing or (if it's a string/number) is None
-            if "reportNumber" not in item:
-                print(f"Deleting item PK: {item['PK']} (Missing reportNumber)")
-                table.delete_item(Key={"PK": item["PK"], "SK": item["SK"]})
-                deleted_count += 1
-            elif item["reportNumber"] is None: 
-                print(f"Deleting item PK: {item['PK']} (Null reportNumber)")
-                table.delete_item(Key={"PK": item["PK"], "SK": item["SK"]})
+
+    with table.batch_writer(overwrite_by_pkeys=["PK", "SK"]) as batch:
+        while True:
+            response = table.scan(**scan_kwargs)
+            for item in response.get("Items", []):
+                print(f"Deleting item PK: {item['PK']} (Missing/null reportNumber)")
+                batch.delete_item(Key={"PK": item["PK"], "SK": item["SK"]})
                 deleted_count += 1
-                
+
+            if "LastEvaluatedKey" not in response:
+                break
+            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    return deleted_count
+
+def cleanup_logs():
+    print(f"Scanning table {TABLE_NAME} for logs without 'reportNumber'...")
+
+    with ThreadPoolExecutor(max_workers=TOTAL_SEGMENTS) as executor:
+        deleted_count = sum(executor.map(cleanup_segment, range(TOTAL_SEGMENTS)))
+
     print(f"Cleanup complete. Deleted {deleted_count} items.")
 
 if __name__ == "__main__":
@@ -1,30 +1,81 @@
 import boto3
 import sys
+import time
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
 
-def clear_table(table_name, profile="mia40", region="eu-west-1"):
-    print(f"Clearing table: {table_name}")
+TOTAL_SEGMENTS = 8
+# batch_writer resends UnprocessedItems immediately; adaptive retries add
+# client-side rate limiting and jittered backoff when the table throttles.
+CLIENT_CONFIG = Config(
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    max_pool_connections=50,
+)
+
+
+def _get_table(table_name, profile="mia40", region="eu-west-1"):
+    # boto3 sessions/resources are not thread-safe, so each worker builds its own
+    session = boto3.Session(profile_name=profile, region_name=region)
+    return session.resource('dynamodb', config=CLIENT_CONFIG).Table(table_name)
+
+
+def prewarm_table(table_name, write_units, profile="mia40", region="eu-west-1"):
+    """
+    Raise an on-demand table's warm write throughput before a bulk delete so
+    the first burst is not throttled. Warm throughput is billed once and can
+    only be raised, so this only runs when asked for (--prewarm-wcu N).
+    """
     session = boto3.Session(profile_name=profile, region_name=region)
-    dynamodb = session.resource('dynamodb')
-    table = dynamodb.Table(table_name)
+    client = session.client('dynamodb', config=CLIENT_CONFIG)
+
+    current = client.describe_table(TableName=table_name)['Table'].get('WarmThroughput', {})
+    if current.get('WriteUnitsPerSecond', 0) >= write_units:
+        return
+
+    print(f"Pre-warming {table_name} to {write_units} WCU/s")
+    client.update_table(TableName=table_name, WarmThroughput={'WriteUnitsPerSecond': write_units})
+    for _ in range(60):
+        status = client.describe_table(TableName=table_name)['Table'].get('WarmThroughput', {}).get('Status')
+        if status == 'ACTIVE':
+            return
+        time.sleep(5)
+    print(f"Warm throughput for {table_name} still {status}; clearing anyway")
+
+
+def clear_segment(table_name, key_names, segment, total_segments):
+    table = _get_table(table_name)
 
-    try:
-        # Scan and delete is inefficient but sufficient for dev/cleanup
-        scan = table.scan()
-        with table.batch_writer() as batch:
+    # Scan and delete is inefficient but sufficient for dev/cleanup.
+    # Only the key attributes are fetched; placeholders escape reserved words.
+    names = {f"#k{i}": name for i, name in enumerate(key_names)}
+    scan_kwargs = {
+        "Segment": segment,
+        "TotalSegments": total_segments,
+        "ProjectionExpression": ", ".join(names),
+        "ExpressionAttributeNames": names,
+    }
+    with table.batch_writer(overwrite_by_pkeys=key_names) as batch:
+        # Each scan page stops at 1MB; follow LastEvaluatedKey to the end
+        while True:
+            scan = table.scan(**scan_kwargs)
             for each in scan['Items']:
-                # We need the primary keys to delete
-                # Assuming simple keys or standard specialized keys for these tables
-                # But batch_writer.delete_item needs the Key dict
-                
-                # Fetch key schema to build key dict
-                key_names = [k['AttributeName'] for k in table.key_schema]
-                key_dict = {k: each[k] for k in key_names}
-                
-                batch.delete_item(Key=key_dict)
-                
-        print(f"Successfully cleared {table_name}")
-    except Exception as e:
-        print(f"Error clearing {table_name}: {e}")
+                batch.delete_item(Key={k: each[k] for k in key_names})
+
+            start_key = scan.get('LastEvaluatedKey')
+            if not start_key:
+                break
+            scan_kwargs["ExclusiveStartKey"] = start_key
+
+
+def clear_table(table_name, executor, total_segments=TOTAL_SEGMENTS):
+    print(f"Clearing table: {table_name}")
+    # One DescribeTable per table; every segment worker reuses the key names
+    key_names = [k['AttributeName'] for k in _get_table(table_name).key_schema]
+    return [
+        executor.submit(clear_segment, table_name, key_names, segment, total_segments)
+        for segment in range(total_segments)
+    ]
+
 
 if __name__ == "__main__":
     tables = [
@@ -33,6 +84,28 @@ if __name__ == "__main__":
         "taskflow-backend-dev-reports",
         "taskflow-backend-dev-conversations"
     ]
-    
-    for table in tables:
-        clear_table(table)
+
+    if "--prewarm-wcu" in sys.argv:
+        write_units = int(sys.argv[sys.argv.index("--prewarm-wcu") + 1])
+        for table in tables:
+            try:
+                prewarm_table(table, write_units)
+            except Exception as e:
+                print(f"Could not pre-warm {table}: {e}")
+
+    # Table- and segment-level parallel scans: the work is all DynamoDB round trips
+    with ThreadPoolExecutor(max_workers=len(tables) * TOTAL_SEGMENTS) as executor:
+        futures = {}
+        for table in tables:
+            try:
+                futures[table] = clear_table(table, executor)
+            except Exception as e:
+                print(f"Error clearing {table}: {e}")
+
+        for table, segment_futures in futures.items():
+            try:
+                for future in segment_futures:
+                    future.result()
+                print(f"Successfully cleared {table}")
+            except Exception as e:
+                print(f"Error clearing {table}: {e}")
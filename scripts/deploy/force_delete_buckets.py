@@ -1,15 +1,85 @@
 import boto3
 import sys
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# DeleteObjects accepts at most 1000 keys per request
+DELETE_BATCH_SIZE = 1000
+DELETE_WORKERS = 16
+# Cap queued batches so memory stays bounded however large the bucket is
+MAX_PENDING_BATCHES = DELETE_WORKERS * 2
+# Error codes from S3-compatible endpoints that lack bulk DeleteObjects
+BULK_DELETE_UNSUPPORTED = ('NotImplemented', 'MethodNotAllowed')
+# Buckets emptied at once; each has its own client and DELETE_WORKERS threads,
+# so at most MAX_PARALLEL_BUCKETS * DELETE_WORKERS delete threads run in total
+MAX_PARALLEL_BUCKETS = 3
+
+
+def _delete_individually(s3, bucket_name, objects):
+    # Runs inside a _delete_batch worker: the outer pool already provides the
+    # parallelism, so a nested pool would only multiply threads per connection
+    for obj in objects:
+        s3.delete_object(Bucket=bucket_name, Key=obj['Key'], VersionId=obj['VersionId'])
+    return len(objects)
+
+
+def _delete_batch(s3, bucket_name, objects):
+    try:
+        response = s3.delete_objects(
+            Bucket=bucket_name, Delete={'Objects': objects, 'Quiet': True}
+        )
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') not in BULK_DELETE_UNSUPPORTED:
+            raise
+        # Endpoint has no bulk delete: fall back to single deletes for this batch
+        return _delete_individually(s3, bucket_name, objects)
+    # Quiet mode only reports the keys that failed
+    errors = response.get('Errors', [])
+    for error in errors:
+        print(f"  Failed to delete {error.get('Key')}: {error.get('Message')}")
+    return len(objects) - len(errors)
+
 
 def empty_bucket(bucket_name, profile="mia40", region="eu-west-1"):
     print(f"Emptying bucket: {bucket_name}")
     session = boto3.Session(profile_name=profile, region_name=region)
-    s3 = session.resource('s3')
-    bucket = s3.Bucket(bucket_name)
+    # Low-level clients are thread-safe, so all delete workers share this one.
+    # botocore's default pool is 10 connections; size it to the worker count
+    # so parallel batches don't discard and reopen connections.
+    s3 = session.client('s3', config=Config(max_pool_connections=DELETE_WORKERS))
 
     try:
-        bucket.object_versions.delete()
-        print(f"Successfully emptied {bucket_name}")
+        paginator = s3.get_paginator('list_object_versions')
+        pages = paginator.paginate(
+            Bucket=bucket_name, PaginationConfig={'PageSize': DELETE_BATCH_SIZE}
+        )
+        deleted = 0
+        pending = set()
+        buf = []
+
+        def submit(batch):
+            nonlocal deleted, pending
+            if len(pending) >= MAX_PENDING_BATCHES:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                deleted += sum(future.result() for future in done)
+            pending.add(executor.submit(_delete_batch, s3, bucket_name, batch))
+
+        with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+            # Stream listing pages into full 1000-key batches; only the current
+            # buffer and the capped in-flight batches are held in memory.
+            for page in pages:
+                buf.extend(
+                    {'Key': v['Key'], 'VersionId': v['VersionId']}
+                    for v in page.get('Versions', []) + page.get('DeleteMarkers', [])
+                )
+                while len(buf) >= DELETE_BATCH_SIZE:
+                    submit(buf[:DELETE_BATCH_SIZE])
+                    del buf[:DELETE_BATCH_SIZE]
+            if buf:
+                submit(buf)
+            deleted += sum(future.result() for future in pending)
+        print(f"Successfully emptied {bucket_name} ({deleted} versions deleted)")
     except Exception as e:
         print(f"Error emptying {bucket_name}: {e}")
 
@@ -19,6 +89,7 @@ if __name__ == "__main__":
         "taskflow-backend-dev-kb",
         "taskflow-backend-dev-serverlessdeploymentbucket-jcboksmgyjz6"
     ]
-    
-    for bucket in buckets:
-        empty_bucket(bucket)
+
+    # Buckets are independent and each is I/O-bound, so empty them concurrently
+    with ThreadPoolExecutor(max_workers=min(len(buckets), MAX_PARALLEL_BUCKETS)) as executor:
+        list(executor.map(empty_bucket, buckets))
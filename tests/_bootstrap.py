@@ -0,0 +1,26 @@
+"""Shared path and module-stub setup for the verify_* scripts."""
+
+import os
+import sys
+from functools import lru_cache
+from unittest.mock import MagicMock
+
+_BASE = os.path.dirname(os.path.abspath(__file__))
+BACKEND = os.path.normpath(os.path.join(_BASE, "..", "backend"))
+
+
+@lru_cache(maxsize=1)
+def setup_paths():
+    """Put backend, lambdas and lambdas/shared on sys.path (once per process)."""
+    sys.path[:0] = [BACKEND, os.path.join(BACKEND, "lambdas"), os.path.join(BACKEND, "lambdas", "shared")]
+
+
+def stub_modules(*names):
+    """
+    Register a fresh MagicMock for each module name, replacing any module
+    already loaded (e.g. a real boto3). Returns the mocks in order.
+    """
+    setup_paths()
+    stubs = [MagicMock() for _ in names]
+    sys.modules.update(zip(names, stubs))
+    return stubs
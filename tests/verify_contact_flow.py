@@ -1,16 +1,10 @@
 
-import sys
-import os
 from unittest.mock import MagicMock, patch
 
-# Add backend to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../backend/lambdas")))
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../backend/lambdas/shared")))
+from _bootstrap import stub_modules
 
 # Mock Dependencies before import
-sys.modules["shared.conversation_state"] = MagicMock()
-sys.modules["shared.twilio_client"] = MagicMock()
-sys.modules["shared.config_manager"] = MagicMock()
+stub_modules("shared.conversation_state", "shared.twilio_client", "shared.config_manager")
 
 # Mock boto3
 import boto3
@@ -21,6 +15,23 @@ from handlers.data_collection_handlers import handle_remarks
 from shared.config_manager import ConfigManager
 from shared.conversation_state import ConversationState
 
+_OPTS = {
+    "PROJECTS": [
+        {
+            "id": "PROJ-1", 
+            "name": "Project Alpha", 
+            "responsible_persons": ["Alpha Eng 1", "Alpha Eng 2"]
+        },
+        {
+            "id": "PROJ-2", 
+            "name": "Project Beta", 
+            "responsible_persons": ["Beta Eng 1"]
+        }
+    ],
+    "RESPONSIBLE_PERSONS": ["Default Person 1"],
+    "STAKEHOLDERS": ["Stakeholder 1"]
+}
+
 def run_test():
     print("--- Verifying Responsible Person Flow ---")
     
@@ -29,22 +40,7 @@ def run_test():
     ConfigManager.return_value = cm
     
     # Mock Project Configuration
-    cm.get_options.side_effect = lambda key: {
-        "PROJECTS": [
-            {
-                "id": "PROJ-1", 
-                "name": "Project Alpha", 
-                "responsible_persons": ["Alpha Eng 1", "Alpha Eng 2"]
-            },
-            {
-                "id": "PROJ-2", 
-                "name": "Project Beta", 
-                "responsible_persons": ["Beta Eng 1"]
-            }
-        ],
-        "RESPONSIBLE_PERSONS": ["Default Person 1"],
-        "STAKEHOLDERS": ["Stakeholder 1"]
-    }.get(key, [])
+    cm.get_options.side_effect = lambda key: _OPTS.get(key, [])
 
     state_manager = MagicMock()
     
@@ -60,9 +56,9 @@ def run_test():
     
     # Test 2: Handle vCard with Single Number
     print("\nTest 2: vCard Single Number")
-    with patch("requests.get") as mock_get:
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.text = "BEGIN:VCARD\nFN:John Doe\nTEL;CELL:+123456789\nEND:VCARD"
+    with patch("handlers.finalization_handler.HTTP.request") as mock_get:
+        mock_get.return_value.status = 200
+        mock_get.return_value.data = b"BEGIN:VCARD\nFN:John Doe\nTEL;CELL:+123456789\nEND:VCARD"
         
         resp = handle_responsible_person("", "123", state_manager, current_state, contact_vcard_url="http://vcard")
         
@@ -76,9 +72,9 @@ def run_test():
 
     # Test 3: Handle vCard with Multiple Numbers
     print("\nTest 3: vCard Multiple Numbers")
-    with patch("requests.get") as mock_get:
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.text = "BEGIN:VCARD\nFN:Jane Smith\nTEL;CELL:+111\nTEL;WORK:+222\nEND:VCARD"
+    with patch("handlers.finalization_handler.HTTP.request") as mock_get:
+        mock_get.return_value.status = 200
+        mock_get.return_value.data = b"BEGIN:VCARD\nFN:Jane Smith\nTEL;CELL:+111\nTEL;WORK:+222\nEND:VCARD"
         
         resp = handle_responsible_person("", "123", state_manager, current_state, contact_vcard_url="http://vcard2")
         
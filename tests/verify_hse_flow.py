@@ -2,23 +2,35 @@
 import sys
 import os
 import json
+import logging
 from unittest.mock import MagicMock, patch
 
-# Add backend to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../backend")))
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../backend/lambdas")))
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../backend/lambdas/shared")))
+from _bootstrap import stub_modules
+
+# Per-step traces are DEBUG; run with VERIFY_HSE_DEBUG=1 to see them
+logging.basicConfig(
+    level=logging.DEBUG if os.environ.get("VERIFY_HSE_DEBUG") else logging.INFO,
+    format="%(message)s",
+)
+log = logging.getLogger("verify_hse")
 
 # Mock external dependencies before importing handlers
-sys.modules["shared.bedrock_client"] = MagicMock()
-sys.modules["shared.s3_client"] = MagicMock()
-sys.modules["shared.twilio_client"] = MagicMock()
-sys.modules["shared.faiss_utils"] = MagicMock()
-sys.modules["shared.kb_repositories"] = MagicMock()
-sys.modules["shared.dynamic_bedrock"] = MagicMock()
-sys.modules["boto3"] = MagicMock()
-sys.modules["lambdas.handlers.safety_check_handler"] = MagicMock()
-sys.modules["lambdas.handlers.safety_check_handler"].perform_safety_check.return_value = ("Always wear PPE", "Safety Manual Page 5")
+bedrock, *_, safety_check = stub_modules(
+    "shared.bedrock_client",
+    "shared.s3_client",
+    "shared.twilio_client",
+    "shared.faiss_utils",
+    "shared.kb_repositories",
+    "shared.dynamic_bedrock",
+    "boto3",
+    "lambdas.handlers.safety_check_handler",
+)
+safety_check.perform_safety_check.return_value = ("Always wear PPE", "Safety Manual Page 5")
+
+# Every BedrockClient() the handlers build returns this one preconfigured mock
+_bedrock = bedrock.BedrockClient.return_value
+_bedrock.classify_observation_type.return_value = "Unsafe Act"
+_bedrock.classify_hazard_type.return_value = ["Working at Height", "Slip Hazard"]
 
 # Mock ConfigManager and UserProjectManager
 from shared.config_manager import ConfigManager
@@ -26,15 +38,17 @@ from shared.user_project_manager import UserProjectManager
 from shared.conversation_state import ConversationState
 
 # Setup Mock Clients
-cm = MagicMock()
-cm.get_options.side_effect = lambda key: {
+_OPTS = {
     "PROJECTS": [{"id": "PROJ-001", "name": "Project Alpha", "locations": ["Site Office", "Zone A"]}],
     "LOCATIONS": ["General Site"],
     "BREACH_SOURCES": ["Subcontractor A", "Team B"],
     "RESPONSIBLE_PERSONS": ["Eng. John", "Supervisor Mike"],
     "STAKEHOLDERS": ["Manager Dave", "HSE Officer Sarah"],
     "HAZARD_TAXONOMY": [{"name": "Working at Height", "category": "A1"}, {"name": "Electrical", "category": "B2"}]
-}.get(key, [])
+}
+
+cm = MagicMock()
+cm.get_options.side_effect = lambda key: _OPTS.get(key, [])
 ConfigManager.return_value = cm
 
 upm = MagicMock()
@@ -44,7 +58,7 @@ UserProjectManager.return_value = upm
 # Local State Mock
 state_store = {}
 def mock_update_state(phone_number, new_state, curr_data=None):
-    print(f"STATE UPDATE: {new_state} | Data: {curr_data}")
+    log.debug("STATE UPDATE: %s | Data: %s", new_state, curr_data)
     state_store[phone_number] = {"currentState": new_state, "draftData": curr_data or {}}
     # Merge data
     if curr_data:
@@ -56,12 +70,12 @@ def mock_get_state(phone_number):
     return state_store.get(phone_number)
     
 def mock_clear_state(phone_number):
-    print("STATE CLEARED")
+    log.debug("STATE CLEARED")
     if phone_number in state_store:
         del state_store[phone_number]
 
 def mock_start_conversation(phone_number, report_id, draft_data, start_state):
-    print(f"START CONVERSATION: {start_state} | Report: {report_id}")
+    log.debug("START CONVERSATION: %s | Report: %s", start_state, report_id)
     state_store[phone_number] = {"currentState": start_state, "draftData": draft_data}
 
 csm = MagicMock()
@@ -89,79 +103,76 @@ from workflow_worker import handler as worker_handler
 
 def run_simulation():
     phone = "1234567890"
-    print("\n--- Starting Simulation ---\n")
+    log.info("--- Starting Simulation ---")
     
     # 1. Start (Image Upload)
-    print("1. User sends photo")
-    # Mock Bedrock classification
-    sys.modules["shared.bedrock_client"].BedrockClient().classify_observation_type.return_value = "Unsafe Act"
-    sys.modules["shared.bedrock_client"].BedrockClient().classify_hazard_type.return_value = ["Working at Height", "Slip Hazard"]
+    log.debug("1. User sends photo")
     
     user_input = {"imageUrl": "http://example.com/photo.jpg", "description": "High work"}
     resp = handle_start(user_input, phone, csm)
-    print(f"Bot: {resp['text'] if isinstance(resp, dict) else resp}")
+    log.debug("Bot: %s", resp['text'] if isinstance(resp, dict) else resp)
     
     # 2. Select Project
-    print("\n2. User selects Project")
+    log.debug("2. User selects Project")
     state_store[phone]["currentState"] = "WAITING_FOR_PROJECT" # Force state if not set by start
     resp = handle_project_selection("PROJ-001", phone, csm)
-    print(f"Bot: {resp['text']}")
+    log.debug("Bot: %s", resp['text'])
     
     # 3. Confirm Type (Yes)
-    print("\n3. User confirms Type (Yes)")
+    log.debug("3. User confirms Type (Yes)")
     state_store[phone]["currentState"] = "WAITING_FOR_CONFIRMATION"
     resp = handle_confirmation("yes", phone, csm, state_store[phone])
-    print(f"Bot: {resp['text']}")
+    log.debug("Bot: %s", resp['text'])
     
     # 4. Confirm Category (Yes)
-    print("\n4. User confirms Category (Yes)")
+    log.debug("4. User confirms Category (Yes)")
     state_store[phone]["currentState"] = "WAITING_FOR_CATEGORY_CONFIRMATION"
     resp = handle_category_confirmation("yes", phone, csm, state_store[phone])
-    print(f"Bot: {resp['text']}")
+    log.debug("Bot: %s", resp['text'])
     
     # 5. Location
-    print("\n5. User sends Location")
+    log.debug("5. User sends Location")
     state_store[phone]["currentState"] = "WAITING_FOR_LOCATION"
     resp = handle_location("Zone A", phone, csm, state_store[phone])
-    print(f"Bot: {resp['text']}")
+    log.debug("Bot: %s", resp['text'])
     
     # 6. Breach Source
-    print("\n6. User selects Source")
+    log.debug("6. User selects Source")
     state_store[phone]["currentState"] = "WAITING_FOR_BREACH_SOURCE"
     resp = handle_breach_source("Subcontractor A", phone, csm, state_store[phone])
-    print(f"Bot: {resp['text']}")
+    log.debug("Bot: %s", resp['text'])
     
     # 7. Severity
-    print("\n7. User selects Severity")
+    log.debug("7. User selects Severity")
     state_store[phone]["currentState"] = "WAITING_FOR_SEVERITY"
     resp = handle_severity("High", phone, csm, state_store[phone])
-    print(f"Bot: {resp['text']}")
+    log.debug("Bot: %s", resp['text'])
     
     # 8. Stop Work
-    print("\n8. User says Stop Work (Yes)")
+    log.debug("8. User says Stop Work (Yes)")
     state_store[phone]["currentState"] = "WAITING_FOR_STOP_WORK"
     resp = handle_stop_work("yes", phone, csm)
-    print(f"Bot: {resp['text']}")
+    log.debug("Bot: %s", resp['text'])
     
     # 9. Remarks
-    print("\n9. User adds Remarks")
+    log.debug("9. User adds Remarks")
     state_store[phone]["currentState"] = "WAITING_FOR_REMARKS" # Check verify if previous step set this
     resp = handle_remarks("Workers not wearing harness.", phone, csm)
-    print(f"Bot: {resp['text']}")
+    log.debug("Bot: %s", resp['text'])
     
     # 10. Responsible Person
-    print("\n10. User selects Responsible Person")
+    log.debug("10. User selects Responsible Person")
     state_store[phone]["currentState"] = "WAITING_FOR_RESPONSIBLE_PERSON"
     resp = handle_responsible_person("Eng. John", phone, csm, state_store[phone])
-    print(f"Bot: {resp['text']}")
+    log.debug("Bot: %s", resp['text'])
     
     # 11. Notified Persons
-    print("\n11. User selects Notified Person")
+    log.debug("11. User selects Notified Person")
     state_store[phone]["currentState"] = "WAITING_FOR_NOTIFIED_PERSONS"
     resp = handle_notified_persons("Manager Dave", phone, csm, state_store[phone])
-    print(f"Bot: {resp}\n") # This returns the final summary string
+    log.debug("Bot: %s", resp) # This returns the final summary string
     
-    print("--- Simulation Complete ---")
+    log.info("--- Simulation Complete ---")
 
 if __name__ == "__main__":
     run_simulation()
@@ -1,16 +1,11 @@
 
-import sys
-import os
+import time
 from unittest.mock import MagicMock
 
-# Add backend to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../backend/lambdas")))
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../backend/lambdas/shared")))
+from _bootstrap import stub_modules
 
 # Mock Dependencies
-sys.modules["shared.conversation_state"] = MagicMock()
-sys.modules["shared.user_project_manager"] = MagicMock()
-sys.modules["shared.config_manager"] = MagicMock()
+stub_modules("shared.conversation_state", "shared.user_project_manager", "shared.config_manager")
 
 from handlers.project_handler import handle_project_selection
 from shared.config_manager import ConfigManager
@@ -69,6 +64,19 @@ def run_test():
     else:
         print("SUCCESS: No Next button on last page")
 
+    # 5. Deep page on a large list: the handler slices, so cost must not grow with N
+    print("\nTest 4: Request Page 500 of 10,000 projects")
+    cm.get_options.return_value = [f"P{i}" for i in range(10_000)]
+    t0 = time.perf_counter()
+    resp = handle_project_selection("next_projects:500", "123", csm)
+    elapsed = time.perf_counter() - t0
+    items = resp["interactive"]["items"]
+    print(f"Elapsed: {elapsed * 1000:.2f} ms")
+
+    assert items[0]["title"] == "P4500"
+    assert items[-1]["id"] == "next_projects:501"
+    assert elapsed < 0.05, f"Page lookup took {elapsed:.3f}s"
+
     print("\n--- Pagination Verified ---")
 
 if __name__ == "__main__":